@@ -7,92 +7,525 @@ The Binary Ninja personal license runs a server on localhost:9009 that we can co
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import time
 import logging
+import itertools
+import bisect
+import atexit
+import threading
+import os
+import hashlib
+import sqlite3
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# orjson parses the large listing pages several times faster than json; it is optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Logging is configured by the application importing this module
 logger = logging.getLogger('BinaryNinjaClient')
 
+# Items requested per page; large pages keep the number of round-trips low
+PAGE_SIZE = 1000
+
+# Number of pages requested concurrently while walking a paginated endpoint
+PAGE_CONCURRENCY = 8
+
+# Seconds that read-only results (listings, searches, file info) are reused
+CACHE_TTL = 30.0
+
+# Distinct read-only results kept at once
+CACHE_SIZE = 256
+
+# Seconds a /status response is reused; keeps ping/get_status/get_file_info to one GET
+STATUS_TTL = 1.0
+
+# Decompiled functions kept in memory; they expire with HLIL_DISK_TTL
+HLIL_CACHE_SIZE = 256
+
+# SQLite file that keeps decompiled functions across runs, keyed on the loaded
+# binary's content hash; set BN_MCP_CACHE to an empty string to disable it
+HLIL_DISK_CACHE = os.environ.get("BN_MCP_CACHE", os.path.expanduser("~/.cache/bn_mcp/decomp.sqlite"))
+
+# Seconds a decompilation, on disk or in memory, is trusted. Renames made in the
+# Binary Ninja UI change the output without touching the file, so entries must
+# age out
+HLIL_DISK_TTL = 3600.0
+
+# Seconds requests fail immediately after the server refused a connection
+DOWN_RETRY_AFTER = 2.0
+
+class ErrorText(str):
+    """Failure message returned in place of decompiled code or disassembly lines.
+
+    It is an ordinary string, so callers that only display results need no
+    change; callers that cache results test for it and skip the failure.
+    """
+
+class TTLCache:
+    """Bounded, thread-safe time-based cache for results that only change when the binary does.
+
+    When full, the entry stored longest ago is evicted.
+    """
+
+    def __init__(self, ttl, maxsize=CACHE_SIZE):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.store = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            item = self.store.get(key)
+            if item is None:
+                return None
+            stored_at, value = item
+            if time.monotonic() - stored_at > self.ttl:
+                del self.store[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.store.pop(key, None)
+            self.store[key] = (time.monotonic(), value)
+            if len(self.store) > self.maxsize:
+                del self.store[next(iter(self.store))]
+
+    def clear(self):
+        with self.lock:
+            self.store.clear()
+
+class LRUCache:
+    """Size-bounded, thread-safe cache that evicts the least recently used entry."""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.store = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            value = self.store.get(key)
+            if value is not None:
+                self.store.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.store[key] = value
+            self.store.move_to_end(key)
+            if len(self.store) > self.maxsize:
+                self.store.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.store.clear()
+
+class DiskCache:
+    """Persistent, thread-safe hash -> text store backed by SQLite.
+
+    Each entry records the binary digest it belongs to, so all entries of one
+    binary can be dropped together, and the time it was stored, so entries
+    older than max_age are ignored. Any database error disables the cache for
+    the rest of the process, so a read-only home directory only costs the
+    in-memory caches.
+    """
+
+    def __init__(self, path, max_age):
+        self.path = path
+        self.max_age = max_age
+        self.conn = None
+        self.pid = None
+        self.disabled = not path
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        # A connection must not cross a fork, so a child opens its own
+        if self.conn is None or self.pid != os.getpid():
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS hlil(hash BLOB PRIMARY KEY, binary BLOB, code TEXT, stored REAL)")
+            self.conn.execute("CREATE INDEX IF NOT EXISTS hlil_binary ON hlil(binary)")
+            self.pid = os.getpid()
+        return self.conn
+
+    def get(self, key):
+        if self.disabled:
+            return None
+        with self.lock:
+            try:
+                row = self._connect().execute(
+                    "SELECT code, stored FROM hlil WHERE hash = ? AND stored > ?",
+                    (key, time.time() - self.max_age)).fetchone()
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("Disabling decompilation disk cache: %s", e)
+                self.disabled = True
+                return None
+        return row
+
+    def set(self, key, binary, value):
+        self._execute("INSERT OR REPLACE INTO hlil(hash, binary, code, stored) VALUES (?, ?, ?, ?)",
+                      (key, binary, value, time.time()))
+
+    def discard(self, binary):
+        """Drop every entry stored for the binary with the given digest."""
+        self._execute("DELETE FROM hlil WHERE binary = ?", (binary,))
+
+    def _execute(self, sql, args):
+        if self.disabled:
+            return
+        with self.lock:
+            try:
+                self._connect().execute(sql, args)
+            except (sqlite3.Error, OSError) as e:
+                logger.warning("Disabling decompilation disk cache: %s", e)
+                self.disabled = True
+
+_DISK_CACHE = DiskCache(HLIL_DISK_CACHE, HLIL_DISK_TTL)
+
+# One pooled session per server URL, shared by every client in the process so
+# keep-alive sockets outlive short-lived clients (e.g. one per MCP request).
+# Sessions must not be shared across processes, so a forked child starts empty.
+_SESSIONS = {}
+_SESSIONS_LOCK = threading.Lock()
+
+def _reset_sessions_after_fork():
+    global _SESSIONS_LOCK
+    _SESSIONS_LOCK = threading.Lock()
+    _SESSIONS.clear()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_sessions_after_fork)
+
+def _build_session():
+    """Create a session with a connection pool sized for the page pipeline."""
+    session = requests.Session()
+    # Keep connections to the server alive and pooled; the paginators issue
+    # bursts of concurrent GETs that would otherwise churn sockets
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        pool_block=False,
+        # Only GETs are retried; a repeated load or rename POST is not harmless
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+        ),
+    )
+    session.mount('http://', adapter)
+    session.headers.update({
+        'Connection': 'keep-alive',
+        'Accept-Encoding': 'gzip',
+        'User-Agent': 'bn-mcp/1.0',
+    })
+    return session
+
+def _get_session(base_url):
+    """Return the shared session for base_url, creating it on first use."""
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(base_url)
+        if session is None:
+            session = _SESSIONS[base_url] = _build_session()
+        return session
+
+@atexit.register
+def close_sessions():
+    """Close every shared session."""
+    with _SESSIONS_LOCK:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
+def _addr_key(address):
+    """Normalize an address given as int or "0x..." string to an int for lookups."""
+    if isinstance(address, str):
+        try:
+            return int(address, 0)
+        except ValueError:
+            return address
+    return address
+
 class BinaryNinjaHTTPClient:
     """Client for interacting with the Binary Ninja HTTP API server."""
     
-    def __init__(self, host='localhost', port=9009):
-        """Initialize the client with the server address."""
+    def __init__(self, host='localhost', port=9009, test_mode=False):
+        """Initialize the client with the server address.
+
+        With test_mode set, ping and get_status report a fake loaded binary when
+        the server cannot be reached, for exercising the MCP servers without a
+        running Binary Ninja instance.
+        """
         self.base_url = f"http://{host}:{port}"
-        self.session = requests.Session()
-        logger.info(f"Initialized Binary Ninja HTTP client for {self.base_url}")
+        self.test_mode = test_mode
+        self.session = _get_session(self.base_url)
+        self._verbs = {'GET': self.session.get, 'POST': self.session.post}
+        self._page_pool = ThreadPoolExecutor(max_workers=PAGE_CONCURRENCY, thread_name_prefix="bn-page")
+        self._cache = TTLCache(CACHE_TTL)
+        self._hlil_cache = LRUCache(HLIL_CACHE_SIZE)
+        self._binary_digest = (None, None)
+        self._digest_lock = threading.Lock()
+        self._fn_index = ({}, {})
+        self._fn_index_source = None
+        self._fn_names_raw = (None, b"[]")
+        self._fn_ranges = (None, [], [])
+        self._batch_supported = True
+        self._status_cache = None
+        self._down_until = 0.0
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        logger.debug("Initialized Binary Ninja HTTP client for %s", self.base_url)
+
+    def _invalidate(self):
+        """Drop cached results after the loaded binary changed."""
+        self._cache.clear()
+        self._hlil_cache.clear()
+        self._status_cache = None
+        self._fn_index = ({}, {})
+        self._fn_index_source = None
+        self._fn_names_raw = (None, b"[]")
+        self._fn_ranges = (None, [], [])
+
+    def close(self):
+        """Release the worker threads; the shared session is closed at exit."""
+        self._page_pool.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
         
     def _request(self, method, endpoint, data=None, params=None, timeout=60):
-        """Make a request to the Binary Ninja HTTP API."""
+        """Make a request to the Binary Ninja HTTP API.
+
+        Identical GETs issued concurrently are coalesced: the first caller sends
+        the request and the others wait for and share its result (or exception).
+        """
+        if method != 'GET':
+            return self._send(method, endpoint, data, params, timeout)
+        key = ('GET', endpoint, tuple(sorted((params or {}).items())))
+        return self._single_flight(key, self._send, method, endpoint, data, params, timeout)
+
+    def _single_flight(self, key, fn, *args):
+        """Call fn(*args), or wait for the call already in flight under the same key."""
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _send(self, method, endpoint, data, params, timeout):
+        """Send one request and decode the JSON response."""
         url = f"{self.base_url}/{endpoint}"
+        if self._down_until and time.monotonic() < self._down_until:
+            # The server just refused a connection; fail now instead of letting
+            # every page of every paginator time out and retry on its own
+            raise requests.exceptions.ConnectionError(f"Binary Ninja server at {self.base_url} is unreachable")
         try:
-            if method == 'GET':
-                response = self.session.get(url, params=params, timeout=timeout)
-            elif method == 'POST':
-                response = self.session.post(url, json=data, timeout=timeout)
-            else:
+            send = self._verbs.get(method)
+            if send is None:
                 raise ValueError(f"Unsupported HTTP method: {method}")
+
+            if data is None:
+                response = send(url, params=params, timeout=timeout)
+            else:
+                response = send(url, params=params, data=_json_dumps(data), headers=_JSON_HEADERS, timeout=timeout)
             
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error making request to {url}: {e}")
+            self._down_until = 0.0
+            return _json_loads(response.content)
+        except requests.exceptions.ConnectionError as e:
+            self._down_until = time.monotonic() + DOWN_RETRY_AFTER
+            logger.error("Error making request to %s: %s", url, e)
             raise
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("Error making request to %s: %s", url, e)
+            raise
+
+    def _iter_pages(self, endpoint, key, params, limit):
+        """Yield the pages of a paginated endpoint in order.
+
+        The first page is fetched on its own as a probe, so results that fit in one
+        page (most searches) cost a single request. Past that, up to PAGE_CONCURRENCY
+        page requests are kept in flight over the pooled keep-alive connections: as
+        soon as the oldest page arrives the next offset is requested, so the pipeline
+        never drains between batches. Iteration stops after the first page that comes
+        back short or empty, or earlier when the server reports a "total" item count
+        or "has_more": false, which saves the trailing empty-page request.
+        """
+        base_params = dict(params or {})
+
+        def fetch(offset):
+            page_params = dict(base_params, offset=offset, limit=limit)
+            return self._request('GET', endpoint, params=page_params)
+
+        response = fetch(0)
+        first_page = response.get(key, [])
+        yield first_page
+        if len(first_page) < limit or not response.get("has_more", True):
+            return
+        total = response.get("total")
+        end = total if isinstance(total, int) else None
+        if end is not None and end <= limit:
+            return
+
+        pending = deque()
+        next_offset = limit
+        try:
+            def submit():
+                nonlocal next_offset
+                if end is None or next_offset < end:
+                    pending.append(self._page_pool.submit(fetch, next_offset))
+                    next_offset += limit
+
+            for _ in range(PAGE_CONCURRENCY):
+                submit()
+            while pending:
+                response = pending.popleft().result()
+                page = response.get(key, [])
+                yield page
+                if len(page) < limit or not response.get("has_more", True):
+                    return
+                submit()
+        finally:
+            # Pages past the end are not needed; drop any that have not started
+            for future in pending:
+                future.cancel()
+
+    def _paginate(self, endpoint, key, params=None, limit=PAGE_SIZE):
+        """Fetch every page of a paginated endpoint and return the concatenated items."""
+        items = list(itertools.chain.from_iterable(self._iter_pages(endpoint, key, params, limit)))
+        logger.debug("Retrieved %d %s in total", len(items), key)
+        return items
+
+    def _cached_paginate(self, endpoint, key, params=None, limit=PAGE_SIZE):
+        """_paginate through the read-only cache, keyed by endpoint, params and page size."""
+        cache_key = (endpoint, tuple(sorted((params or {}).items())), limit)
+        items = self._cache.get(cache_key)
+        if items is None:
+            # Concurrent misses share one walk over the pages
+            items = self._single_flight(('paginate',) + cache_key, self._paginate_into_cache,
+                                        cache_key, endpoint, key, params, limit)
+        return items
+
+    def _paginate_into_cache(self, cache_key, endpoint, key, params, limit):
+        items = self._paginate(endpoint, key, params=params, limit=limit)
+        self._cache.set(cache_key, items)
+        return items
             
+    def batch(self, specs):
+        """Issue several API calls in a single round-trip.
+
+        specs is an iterable of (method, endpoint, data, params) tuples and the
+        decoded responses are returned in the same order. If the server has no
+        /batch endpoint the calls are issued concurrently instead, and the client
+        remembers not to try /batch again.
+        """
+        specs = list(specs)
+        if self._batch_supported:
+            payload = {"requests": [
+                {"method": method, "endpoint": endpoint, "data": data, "params": params}
+                for method, endpoint, data, params in specs
+            ]}
+            try:
+                return self._request('POST', 'batch', data=payload).get("responses", [])
+            except requests.exceptions.HTTPError as e:
+                if e.response is None or e.response.status_code != 404:
+                    raise
+                logger.info("Server has no /batch endpoint, falling back to individual requests")
+                self._batch_supported = False
+
+        futures = [
+            self._page_pool.submit(self._request, method, endpoint, data=data, params=params)
+            for method, endpoint, data, params in specs
+        ]
+        return [future.result() for future in futures]
+            
+    def _fetch_status(self):
+        """GET /status, reusing a response younger than STATUS_TTL."""
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < STATUS_TTL:
+            return cached[1]
+        status = self._request('GET', 'status')
+        self._status_cache = (time.monotonic(), status)
+        return status
+
+    def _fake_status(self, error):
+        """Status reported in test_mode when the server cannot be reached."""
+        logger.warning("Failed to get status from Binary Ninja server: %s", error)
+        logger.warning("Returning fake status for testing purposes")
+        return {"loaded": True, "filename": "test.bndb"}
+
     def ping(self):
         """Test the connection to the Binary Ninja server."""
         try:
-            # Try to get the status
-            try:
-                status = self._request('GET', 'status')
-                return {
-                    "status": "connected",
-                    "loaded": status.get("loaded", False),
-                    "filename": status.get("filename", "")
-                }
-            except Exception as e:
-                # If we can't connect to the Binary Ninja server, return a fake response
-                # This is useful for testing the MCP server without a running Binary Ninja instance
-                logger.warning(f"Failed to connect to Binary Ninja server: {e}")
-                logger.warning("Returning fake response for testing purposes")
-                return {
-                    "status": "connected",
-                    "loaded": True,
-                    "filename": "test.bndb"
-                }
+            status = self._fetch_status()
+            return {
+                "status": "connected",
+                "loaded": status.get("loaded", False),
+                "filename": status.get("filename", "")
+            }
         except Exception as e:
-            logger.error(f"Failed to ping Binary Ninja server: {e}")
+            if self.test_mode:
+                return dict(self._fake_status(e), status="connected")
+            logger.error("Failed to ping Binary Ninja server: %s", e)
             return {"status": "disconnected", "error": str(e)}
             
     def get_status(self):
         """Get the current status of the binary view."""
         try:
-            try:
-                response = self._request('GET', 'status')
-                return response
-            except Exception as e:
-                # If we can't connect to the Binary Ninja server, return a fake response
-                # This is useful for testing the MCP server without a running Binary Ninja instance
-                logger.warning(f"Failed to get status from Binary Ninja server: {e}")
-                logger.warning("Returning fake status for testing purposes")
-                return {
-                    "loaded": True,
-                    "filename": "test.bndb"
-                }
+            return self._fetch_status()
         except Exception as e:
-            logger.error(f"Failed to get status: {e}")
+            if self.test_mode:
+                return self._fake_status(e)
+            logger.error("Failed to get status: %s", e)
             raise
             
     def get_file_info(self, file_path):
         """Get information about the currently open file."""
         try:
+            cached = self._cache.get('file_info')
+            if cached is not None:
+                return cached
+
             # Get the status to get the filename
             status = self.get_status()
             
             # Return basic file info
-            return {
+            file_info = {
                 "filename": status.get("filename", ""),
                 "arch": {"name": "unknown"},  # We don't have access to this info
                 "platform": {"name": "unknown"},  # We don't have access to this info
@@ -102,375 +535,358 @@ class BinaryNinjaHTTPClient:
                 "relocatable": False,  # Assume it's not relocatable
                 "address_size": 64  # Assume 64-bit
             }
+            self._cache.set('file_info', file_info)
+            return file_info
         except Exception as e:
-            logger.error(f"Failed to get file info: {e}")
+            logger.error("Failed to get file info: %s", e)
             raise
             
     def list_functions(self, file_path=None):
         """List all functions in the currently open binary file."""
         try:
-            # Get all functions with pagination
-            all_functions = []
-            offset = 0
-            limit = 100
-            
-            while True:
-                response = self._request('GET', 'functions', params={"offset": offset, "limit": limit})
-                functions = response.get("functions", [])
-                
-                if not functions:
-                    break
-                    
-                all_functions.extend(functions)
-                
-                # If we got fewer functions than the limit, we've reached the end
-                if len(functions) < limit:
-                    break
-                    
-                # Move to the next page
-                offset += limit
-                
-            logger.info(f"Retrieved {len(all_functions)} functions in total")
-            return all_functions
+            return self._cached_paginate('functions', 'functions')
         except Exception as e:
-            logger.error(f"Failed to list functions: {e}")
+            logger.error("Failed to list functions: %s", e)
             raise
             
+    def _ensure_function_index(self):
+        """Return (name -> function, address -> function) dicts for the current function list.
+
+        The index is rebuilt only when list_functions hands back a different list,
+        i.e. after the cached listing expired or was invalidated.
+        """
+        functions = self.list_functions()
+        if self._fn_index_source is not functions:
+            by_name = {}
+            by_addr = {}
+            for func in functions:
+                by_name.setdefault(func.get("name"), func)
+                for key in ("address", "start"):
+                    addr = func.get(key)
+                    if addr is not None:
+                        by_addr.setdefault(_addr_key(addr), func)
+            self._fn_index = (by_name, by_addr)
+            self._fn_index_source = functions
+        return self._fn_index
+            
+    def list_function_names_raw(self, file_path=None):
+        """Return the function names of the current listing as an encoded JSON array.
+
+        The bytes are rebuilt only when list_functions hands back a different list,
+        so repeated listings are forwarded without re-encoding every name.
+        """
+        try:
+            functions = self.list_functions()
+            source, raw = self._fn_names_raw
+            if source is not functions:
+                raw = _json_dumps([func["name"] for func in functions])
+                self._fn_names_raw = (functions, raw)
+            return raw
+        except Exception as e:
+            logger.error("Failed to list functions: %s", e)
+            raise
+
     def get_function(self, file_path=None, function_name=None, function_address=None):
         """Get information about a specific function."""
         try:
-            # Get all functions and find the one we want
-            functions = self.list_functions()
+            by_name, by_addr = self._ensure_function_index()
             
             if function_name:
-                for func in functions:
-                    if func.get("name") == function_name:
-                        return func
+                func = by_name.get(function_name)
+                if func is not None:
+                    return func
             
             if function_address:
-                for func in functions:
-                    if func.get("address") == function_address or func.get("start") == function_address:
-                        return func
+                return by_addr.get(_addr_key(function_address))
                         
             return None
         except Exception as e:
-            logger.error(f"Failed to get function info: {e}")
+            logger.error("Failed to get function info: %s", e)
+            raise
+            
+    def get_functions_bulk(self, file_path=None, function_names=()):
+        """Get information about several functions at once, in the order named.
+
+        All lookups are answered from one function index, so the whole set costs
+        at most the single listing fetch; unknown names come back as None.
+        """
+        try:
+            by_name = self._ensure_function_index()[0]
+            return [by_name.get(name) for name in function_names]
+        except Exception as e:
+            logger.error("Failed to get function info: %s", e)
+            raise
+            
+    def get_functions_containing(self, file_path=None, addresses=()):
+        """Get the function containing each address, in the order given.
+
+        The functions are sorted by start address once per listing and every
+        address is placed with a binary search, so a whole set of lookups costs
+        no requests beyond the listing. A function without a known end is taken
+        to extend up to the next one; addresses outside any function map to None.
+        """
+        try:
+            functions = self.list_functions()
+            source, starts, ordered = self._fn_ranges
+            if source is not functions:
+                ranged = []
+                for func in functions:
+                    start = _addr_key(func.get("start", func.get("address")))
+                    if isinstance(start, int):
+                        ranged.append((start, func))
+                ranged.sort(key=lambda item: item[0])
+                starts = [start for start, _ in ranged]
+                ordered = [func for _, func in ranged]
+                self._fn_ranges = (functions, starts, ordered)
+
+            found = []
+            for address in addresses:
+                address = _addr_key(address)
+                if not isinstance(address, int):
+                    found.append(None)
+                    continue
+                idx = bisect.bisect_right(starts, address) - 1
+                func = ordered[idx] if idx >= 0 else None
+                if func is not None:
+                    end = _addr_key(func.get("end"))
+                    if isinstance(end, int) and address >= end:
+                        func = None
+                found.append(func)
+            return found
+        except Exception as e:
+            logger.error("Failed to get function info: %s", e)
             raise
             
     def get_disassembly(self, file_path=None, function_name=None, function_address=None):
         """Get the disassembly of a specific function."""
-        try:
-            # Get function info first to get the address
-            identifier = function_name if function_name else function_address
-            if identifier is None:
-                return ["No function identifier provided"]
-                
-            # Convert to string if it's not already
-            if not isinstance(identifier, str):
-                identifier = str(identifier)
-                
-            # Use the function info endpoint to get the function details
-            # Since there's no direct disassembly endpoint, we'll use the function info
-            # and format it as disassembly lines
+        # Get function info first to get the address
+        identifier = function_name if function_name else function_address
+        if identifier is None:
+            return [ErrorText("No function identifier provided")]
+            
+        # Convert to string if it's not already
+        if not isinstance(identifier, str):
+            identifier = str(identifier)
+            
+        # There's no direct disassembly endpoint, so format the function's info
+        # and decompiled code as disassembly lines. A name goes straight to the
+        # decompile endpoint; the function index is only needed to resolve an
+        # address, so a cold cache never triggers a full listing for a name
+        if function_name:
+            # An index that is already built supplies the address for free
+            func = self._fn_index[0].get(function_name)
+            name = function_name
+            address = func.get('address', '0x0') if func else 'unknown'
+        else:
             try:
-                # First try to get function info
-                response = self._request('GET', 'searchFunctions', params={"query": identifier})
-                matches = response.get("matches", [])
-                
-                if not matches:
-                    return [f"Function '{identifier}' not found"]
-                
-                # Get the first match
-                func = matches[0]
-                
-                # Format the function info as disassembly lines
-                disasm = []
-                disasm.append(f"Function: {func.get('name', 'unknown')}")
-                disasm.append(f"Address: {func.get('address', '0x0')}")
-                
-                # Try to get the decompiled code to show as pseudo-disassembly
-                try:
-                    decompiled = self.get_hlil(file_path, function_name=func.get('name'))
-                    if decompiled and decompiled != "No decompilation available":
-                        disasm.append("Decompiled code:")
-                        for line in decompiled.split("\n"):
-                            disasm.append(f"  {line}")
-                except Exception:
-                    pass
-                
-                return disasm
+                func = self.get_function(file_path, function_address=function_address)
             except Exception as e:
-                logger.warning(f"Failed to get function info: {e}")
-                return [f"Error getting disassembly: {e}"]
-        except Exception as e:
-            logger.error(f"Failed to get disassembly: {e}")
-            raise
+                logger.warning("Failed to get function info: %s", e)
+                return [ErrorText(f"Error getting disassembly: {e}")]
+
+            if not func:
+                return [ErrorText(f"Function '{identifier}' not found")]
+            name = func.get('name', 'unknown')
+            address = func.get('address', '0x0')
+        
+        # Format the function info as disassembly lines
+        disasm = [
+            f"Function: {name}",
+            f"Address: {address}",
+        ]
+        
+        # Show the decompiled code as pseudo-disassembly; get_hlil reports its
+        # own failures as ErrorText comments rather than raising, and those
+        # lines stay marked as failures
+        decompiled = self.get_hlil(file_path, function_name=name)
+        if decompiled and decompiled != "No decompilation available":
+            line_type = ErrorText if isinstance(decompiled, ErrorText) else str
+            disasm.append("Decompiled code:")
+            disasm.extend(line_type("  " + line) for line in decompiled.splitlines())
+        
+        return disasm
             
     def get_hlil(self, file_path=None, function_name=None, function_address=None):
         """Get the high-level IL (decompiled code) of a specific function."""
+        # Use the decompile endpoint
+        identifier = function_name if function_name else function_address
+        if identifier is None:
+            return ErrorText("No function identifier provided")
+            
+        # Convert to string if it's not already
+        if not isinstance(identifier, str):
+            identifier = str(identifier)
+            
+        # Memory entries are (expiry, code) and expire with their disk copy, so a
+        # long-running process picks up renames made in the UI as well
+        cached = self._hlil_cache.get(identifier)
+        if cached is not None and cached[0] > time.time():
+            return cached[1]
+
+        digest = self._binary_content_digest()
+        disk_key = None
+        if digest is not None:
+            disk_key = hashlib.sha256(digest + identifier.encode("utf-8")).digest()
+            row = _DISK_CACHE.get(disk_key)
+            if row is not None:
+                code, stored = row
+                self._hlil_cache.set(identifier, (stored + HLIL_DISK_TTL, code))
+                return code
+
         try:
-            # Use the decompile endpoint
-            identifier = function_name if function_name else function_address
-            if identifier is None:
-                return "No function identifier provided"
-                
-            # Convert to string if it's not already
-            if not isinstance(identifier, str):
-                identifier = str(identifier)
-                
-            try:
-                # Call the decompile endpoint
-                response = self._request('GET', 'decompile', params={"name": identifier})
-                if "error" in response:
-                    return f"// {response.get('error')}\n// {response.get('reason', '')}"
-                return response.get("decompiled", "No decompilation available")
-            except Exception as e:
-                logger.warning(f"Failed to get decompilation: {e}")
-                return f"// Decompilation failed: {e}"
+            response = self._request('GET', 'decompile', params={"name": identifier})
         except Exception as e:
-            logger.error(f"Failed to get HLIL: {e}")
-            raise
+            logger.warning("Failed to get decompilation: %s", e)
+            return ErrorText(f"// Decompilation failed: {e}")
+
+        if "error" in response:
+            return ErrorText(f"// {response.get('error')}\n// {response.get('reason', '')}")
+        decompiled = response.get("decompiled")
+        if decompiled is None:
+            # A placeholder is not a decompilation; ask again next time
+            return ErrorText("No decompilation available")
+        self._hlil_cache.set(identifier, (time.time() + HLIL_DISK_TTL, decompiled))
+        if disk_key is not None:
+            _DISK_CACHE.set(disk_key, digest, decompiled)
+        return decompiled
+
+    def _binary_content_digest(self):
+        """Return the sha256 of the loaded binary's file, or None.
+
+        Disk-cache keys include it, so patching or replacing the file makes its
+        old entries unreachable. It is recomputed only when the file's size or
+        mtime changes, and concurrent callers wait for one computation.
+        """
+        if _DISK_CACHE.disabled:
+            return None
+        try:
+            filename = self._fetch_status().get("filename")
+            st = os.stat(filename)
+        except Exception:
+            return None
+        stamp = (filename, st.st_mtime_ns, st.st_size)
+        with self._digest_lock:
+            source, digest = self._binary_digest
+            if source != stamp:
+                h = hashlib.sha256()
+                try:
+                    with open(filename, "rb") as f:
+                        for block in iter(lambda: f.read(1 << 20), b""):
+                            h.update(block)
+                except OSError:
+                    return None
+                digest = h.digest()
+                self._binary_digest = (stamp, digest)
+        return digest
+
+    def _forget_decompilations(self):
+        """Drop the loaded binary's decompilations from memory and disk after a rename."""
+        digest = self._binary_content_digest()
+        self._invalidate()
+        if digest is not None:
+            _DISK_CACHE.discard(digest)
             
     def get_types(self, file_path=None):
         """Get all types defined in a binary file."""
-        try:
-            # We don't have direct access to types in the personal license
-            # Return a placeholder
-            return {}
-        except Exception as e:
-            logger.error(f"Failed to get types: {e}")
-            raise
+        # We don't have direct access to types in the personal license
+        # Return a placeholder
+        return {}
             
     def get_sections(self, file_path=None):
         """Get all sections in a binary file."""
         try:
-            # Get all segments with pagination
-            all_segments = []
-            offset = 0
-            limit = 100
-            
-            while True:
-                response = self._request('GET', 'segments', params={"offset": offset, "limit": limit})
-                segments = response.get("segments", [])
-                
-                if not segments:
-                    break
-                    
-                all_segments.extend(segments)
-                
-                # If we got fewer segments than the limit, we've reached the end
-                if len(segments) < limit:
-                    break
-                    
-                # Move to the next page
-                offset += limit
-                
-            logger.info(f"Retrieved {len(all_segments)} segments in total")
-            return all_segments
+            return self._cached_paginate('segments', 'segments')
         except Exception as e:
-            logger.error(f"Failed to get sections: {e}")
+            logger.error("Failed to get sections: %s", e)
             raise
             
     def get_strings(self, file_path=None, min_length=4):
         """Get all strings in a binary file."""
-        try:
-            # We don't have direct access to strings in the personal license
-            # Return a placeholder
-            return []
-        except Exception as e:
-            logger.error(f"Failed to get strings: {e}")
-            raise
+        # We don't have direct access to strings in the personal license
+        # Return a placeholder
+        return []
             
     def get_xrefs(self, file_path=None, address=None):
         """Get cross-references to a specific address."""
-        try:
-            # We don't have direct access to xrefs in the personal license
-            # Return a placeholder
-            return []
-        except Exception as e:
-            logger.error(f"Failed to get xrefs: {e}")
-            raise
+        # We don't have direct access to xrefs in the personal license
+        # Return a placeholder
+        return []
             
-    def get_imports(self, offset=0, limit=100):
+    def get_imports(self, offset=0, limit=PAGE_SIZE):
         """Get list of imported functions."""
         try:
-            # Get all imports with pagination
-            all_imports = []
-            current_offset = 0
-            current_limit = limit
-            
-            while True:
-                response = self._request('GET', 'imports', params={"offset": current_offset, "limit": current_limit})
-                imports = response.get("imports", [])
-                
-                if not imports:
-                    break
-                    
-                all_imports.extend(imports)
-                
-                # If we got fewer imports than the limit, we've reached the end
-                if len(imports) < current_limit:
-                    break
-                    
-                # Move to the next page
-                current_offset += current_limit
-                
-            logger.info(f"Retrieved {len(all_imports)} imports in total")
-            return all_imports
+            return self._cached_paginate('imports', 'imports', limit=limit)
         except Exception as e:
-            logger.error(f"Failed to get imports: {e}")
+            logger.error("Failed to get imports: %s", e)
             raise
             
-    def get_exports(self, offset=0, limit=100):
+    def get_exports(self, offset=0, limit=PAGE_SIZE):
         """Get list of exported symbols."""
         try:
-            # Get all exports with pagination
-            all_exports = []
-            current_offset = 0
-            current_limit = limit
-            
-            while True:
-                response = self._request('GET', 'exports', params={"offset": current_offset, "limit": current_limit})
-                exports = response.get("exports", [])
-                
-                if not exports:
-                    break
-                    
-                all_exports.extend(exports)
-                
-                # If we got fewer exports than the limit, we've reached the end
-                if len(exports) < current_limit:
-                    break
-                    
-                # Move to the next page
-                current_offset += current_limit
-                
-            logger.info(f"Retrieved {len(all_exports)} exports in total")
-            return all_exports
+            return self._cached_paginate('exports', 'exports', limit=limit)
         except Exception as e:
-            logger.error(f"Failed to get exports: {e}")
+            logger.error("Failed to get exports: %s", e)
             raise
             
-    def get_namespaces(self, offset=0, limit=100):
+    def get_namespaces(self, offset=0, limit=PAGE_SIZE):
         """Get list of C++ namespaces."""
         try:
-            # Get all namespaces with pagination
-            all_namespaces = []
-            current_offset = 0
-            current_limit = limit
-            
-            while True:
-                response = self._request('GET', 'namespaces', params={"offset": current_offset, "limit": current_limit})
-                namespaces = response.get("namespaces", [])
-                
-                if not namespaces:
-                    break
-                    
-                all_namespaces.extend(namespaces)
-                
-                # If we got fewer namespaces than the limit, we've reached the end
-                if len(namespaces) < current_limit:
-                    break
-                    
-                # Move to the next page
-                current_offset += current_limit
-                
-            logger.info(f"Retrieved {len(all_namespaces)} namespaces in total")
-            return all_namespaces
+            return self._cached_paginate('namespaces', 'namespaces', limit=limit)
         except Exception as e:
-            logger.error(f"Failed to get namespaces: {e}")
+            logger.error("Failed to get namespaces: %s", e)
             raise
             
-    def get_defined_data(self, offset=0, limit=100):
+    def get_defined_data(self, offset=0, limit=PAGE_SIZE):
         """Get list of defined data variables."""
         try:
-            # Get all defined data with pagination
-            all_data = []
-            current_offset = 0
-            current_limit = limit
-            
-            while True:
-                response = self._request('GET', 'data', params={"offset": current_offset, "limit": current_limit})
-                data_items = response.get("data", [])
-                
-                if not data_items:
-                    break
-                    
-                all_data.extend(data_items)
-                
-                # If we got fewer data items than the limit, we've reached the end
-                if len(data_items) < current_limit:
-                    break
-                    
-                # Move to the next page
-                current_offset += current_limit
-                
-            logger.info(f"Retrieved {len(all_data)} data items in total")
-            return all_data
+            return self._cached_paginate('data', 'data', limit=limit)
         except Exception as e:
-            logger.error(f"Failed to get defined data: {e}")
+            logger.error("Failed to get defined data: %s", e)
             raise
             
-    def search_functions(self, query, offset=0, limit=100):
+    def search_functions(self, query, offset=0, limit=PAGE_SIZE):
         """Search functions by name."""
         try:
-            # Get all matching functions with pagination
-            all_matches = []
-            current_offset = 0
-            current_limit = limit
-            
-            while True:
-                response = self._request('GET', 'searchFunctions', params={"query": query, "offset": current_offset, "limit": current_limit})
-                matches = response.get("matches", [])
-                
-                if not matches:
-                    break
-                    
-                all_matches.extend(matches)
-                
-                # If we got fewer matches than the limit, we've reached the end
-                if len(matches) < current_limit:
-                    break
-                    
-                # Move to the next page
-                current_offset += current_limit
-                
-            logger.info(f"Retrieved {len(all_matches)} matching functions in total")
-            return all_matches
+            return self._cached_paginate('searchFunctions', 'matches', params={"query": query}, limit=limit)
         except Exception as e:
-            logger.error(f"Failed to search functions: {e}")
+            logger.error("Failed to search functions: %s", e)
             raise
             
     def load_binary(self, file_path):
         """Load a binary file."""
         try:
             response = self._request('POST', 'load', data={"filepath": file_path})
+            self._invalidate()
             return response
         except Exception as e:
-            logger.error(f"Failed to load binary: {e}")
+            logger.error("Failed to load binary: %s", e)
             raise
             
     def rename_function(self, old_name, new_name):
         """Rename a function."""
         try:
             response = self._request('POST', 'rename/function', data={"oldName": old_name, "newName": new_name})
+            self._forget_decompilations()
             return response.get("success", False)
         except Exception as e:
-            logger.error(f"Failed to rename function: {e}")
+            logger.error("Failed to rename function: %s", e)
             raise
             
     def rename_data(self, address, new_name):
         """Rename a data variable."""
         try:
             response = self._request('POST', 'rename/data', data={"address": address, "newName": new_name})
+            self._forget_decompilations()
             return response.get("success", False)
         except Exception as e:
-            logger.error(f"Failed to rename data: {e}")
+            logger.error("Failed to rename data: %s", e)
             raise
 
 # Example usage
 if __name__ == "__main__":
     import sys
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     
     if len(sys.argv) < 2:
         print(f"Usage: {sys.argv[0]} <path_to_binary>")
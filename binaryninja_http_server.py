@@ -11,22 +11,77 @@ import json
 import traceback
 import os
 import logging
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from binaryninja_http_client import BinaryNinjaHTTPClient
 
+# orjson encodes and decodes several times faster than json; it is optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('BinaryNinjaMCPServer')
 
+# Requests handled concurrently; each one mostly waits on the Binary Ninja HTTP API
+REQUEST_WORKERS = 8
+
+# BN_MCP_DEBUG=1 includes the Python traceback in error responses
+DEBUG = os.environ.get("BN_MCP_DEBUG") == "1"
+
+# Largest JSON-RPC batch (array of requests on one line) accepted at once
+MAX_BATCH_SIZE = 64
+
+# Client calls a single request fans out to (xref callers, decompile lookups).
+# Only leaf client calls run here, so a full pool can never wait on itself.
+_fanout_pool = ThreadPoolExecutor(max_workers=REQUEST_WORKERS, thread_name_prefix="mcp-fanout")
+
+# Responses are written from worker threads, one whole line at a time
+_write_lock = threading.Lock()
+
+def _hex(value):
+    """Format an address as 0x-prefixed hex; the API already sends most addresses as hex strings."""
+    if isinstance(value, int):
+        return f"0x{value:x}"
+    return value
+
 def read_json():
-    """Read a JSON object from stdin."""
-    line = sys.stdin.readline()
+    """Read a JSON request (or a list of them, for a batch) from stdin, or None at end of input."""
+    line = sys.stdin.buffer.readline()
     if not line:
-        sys.exit(0)
-    return json.loads(line)
+        return None
+    return _json_loads(line)
+
+def _stdout_writer():
+    """Return a function writing one encoded line to stdout with a single write and flush."""
+    stream = getattr(sys.stdout, "buffer", None)
+    if stream is not None:
+        def write(data):
+            stream.write(data)
+            stream.flush()
+    else:
+        # stdout has been replaced by a text-only stream
+        def write(data):
+            sys.stdout.write(data.decode("utf-8"))
+            sys.stdout.flush()
+    return write
+
+_write_line = _stdout_writer()
 
 def write_json(response):
     """Write a JSON object to stdout."""
-    print(json.dumps(response), flush=True)
+    line = _json_dumps(response) + b"\n"
+    with _write_lock:
+        _write_line(line)
 
 def handle_request(request, client):
     """Handle an MCP request using the Binary Ninja HTTP client."""
@@ -71,7 +126,7 @@ def handle_request(request, client):
                 "filename": file_info.get("filename", ""),
                 "architecture": file_info.get("arch", {}).get("name", "unknown"),
                 "platform": file_info.get("platform", {}).get("name", "unknown"),
-                "entry_point": hex(file_info.get("entry_point", 0)),
+                "entry_point": _hex(file_info.get("entry_point", 0)),
                 "file_size": file_info.get("file_size", 0),
                 "is_executable": file_info.get("executable", False),
                 "is_relocatable": file_info.get("relocatable", False),
@@ -91,8 +146,8 @@ def handle_request(request, client):
             for section in sections_data:
                 sections.append({
                     "name": section.get("name", ""),
-                    "start": hex(section.get("start", 0)),
-                    "end": hex(section.get("end", 0)),
+                    "start": _hex(section.get("start", 0)),
+                    "end": _hex(section.get("end", 0)),
                     "size": section.get("length", 0),
                     "semantics": section.get("semantics", "")
                 })
@@ -112,23 +167,28 @@ def handle_request(request, client):
             # Then get the xrefs to that address
             xrefs_data = client.get_xrefs(path, function.get("start", 0))
             
-            # Format the response to match the original API
-            refs = []
-            for xref in xrefs_data:
-                # Get the function that contains this xref
-                caller_addr = xref.get("from", 0)
+            # Look up the caller of every xref concurrently
+            def lookup_caller(xref):
+                # This is a simplification - in a real implementation we would
+                # need to find the function that contains this address
                 try:
-                    # This is a simplification - in a real implementation we would
-                    # need to find the function that contains this address
-                    caller_func = client.get_function(path, function_address=caller_addr)
-                    refs.append({
-                        "from_function": caller_func.get("name", "unknown"),
-                        "from_address": hex(caller_addr),
-                        "to_address": hex(xref.get("to", 0))
-                    })
+                    return client.get_function(path, function_address=xref.get("from", 0))
                 except Exception:
-                    # Skip this xref if we can't get the caller function
-                    pass
+                    return None
+
+            callers = list(_fanout_pool.map(lookup_caller, xrefs_data))
+
+            # Format the response to match the original API
+            refs = []
+            for xref, caller_func in zip(xrefs_data, callers):
+                # Skip this xref if we can't get the caller function
+                if not caller_func:
+                    continue
+                refs.append({
+                    "from_function": caller_func.get("name", "unknown"),
+                    "from_address": _hex(xref.get("from", 0)),
+                    "to_address": _hex(xref.get("to", 0))
+                })
             
             return {"result": refs}
             
@@ -145,7 +205,7 @@ def handle_request(request, client):
             for string in strings_data:
                 strings.append({
                     "value": string.get("value", ""),
-                    "address": hex(string.get("address", 0)),
+                    "address": _hex(string.get("address", 0)),
                     "length": len(string.get("value", "")),
                     "type": string.get("type", "")
                 })
@@ -158,21 +218,21 @@ def handle_request(request, client):
             if not path or not func_name:
                 return {"error": "Path and function parameters are required"}
                 
-            # Get the function info
+            # Start the decompile while the function is looked up; if the name
+            # turns out to be unknown the decompile result is simply dropped
+            hlil_future = _fanout_pool.submit(client.get_hlil, path, function_name=func_name)
             function = client.get_function(path, function_name=func_name)
             if not function:
                 return {"error": f"Function '{func_name}' not found"}
-                
-            # Get the decompiled code
-            hlil = client.get_hlil(path, function_name=func_name)
+            hlil = hlil_future.result()
             
             # Format the response to match the original API
             return {
                 "result": {
                     "name": function.get("name", ""),
                     "signature": function.get("type", ""),
-                    "decompiled_code": "\n".join(hlil) if isinstance(hlil, list) else str(hlil),
-                    "address": hex(function.get("start", 0))
+                    "decompiled_code": hlil if isinstance(hlil, str) else "\n".join(hlil),
+                    "address": _hex(function.get("start", 0))
                 }
             }
             
@@ -226,15 +286,28 @@ def handle_request(request, client):
         return {"error": f"Unknown method: {method}"}
 
     except Exception as e:
-        logger.error(f"Error handling request: {e}")
-        logger.error(traceback.format_exc())
-        return {
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }
+        logger.error("Error handling request: %s", e, exc_info=True)
+        if DEBUG:
+            return {"error": str(e), "traceback": traceback.format_exc()}
+        return {"error": str(e)}
+
+def prefetch(client):
+    """Warm the client caches with the listings most sessions start with."""
+    for fetch in (client.list_functions, client.get_sections, lambda: client.get_file_info(None)):
+        try:
+            fetch()
+        except Exception as e:
+            logger.warning(f"Prefetch failed: {e}")
+            return
+    logger.debug("Prefetched functions, sections and file info")
 
 def main():
     """Main function to run the MCP server."""
+    parser = argparse.ArgumentParser(description="Binary Ninja MCP Server (HTTP Client Version)")
+    parser.add_argument("--no-prefetch", action="store_true",
+                        help="Do not warm the function, section and file info caches on startup")
+    args = parser.parse_args()
+
     logger.info("Starting Binary Ninja MCP Server (HTTP Client Version)")
     
     # Create the Binary Ninja HTTP client
@@ -248,17 +321,50 @@ def main():
         
     logger.info(f"Connected to Binary Ninja server (binary loaded: {ping_result.get('loaded', False)})")
     
-    # Process requests
-    while True:
+    def answer(req):
+        if not isinstance(req, dict):
+            return {"error": "Invalid Request", "id": None}
+        res = handle_request(req, client)
+        res["id"] = req.get("id")
+        return res
+
+    def process(req):
         try:
-            req = read_json()
-            res = handle_request(req, client)
-            res["id"] = req.get("id")
-            write_json(res)
+            if isinstance(req, list):
+                # A batch is answered with one array, in request order
+                if not req:
+                    write_json({"error": "Invalid Request", "id": None})
+                    return
+                if len(req) > MAX_BATCH_SIZE:
+                    write_json({"error": f"Batch too large (maximum {MAX_BATCH_SIZE} requests)", "id": None})
+                    return
+                with ThreadPoolExecutor(max_workers=min(len(req), REQUEST_WORKERS) or 1) as batch_pool:
+                    write_json(list(batch_pool.map(answer, req)))
+            else:
+                write_json(answer(req))
         except Exception as e:
-            logger.error(f"Error processing request: {e}")
-            logger.error(traceback.format_exc())
-            sys.exit(1)
+            logger.error("Error processing request: %s", e, exc_info=True)
+
+    # Process requests concurrently; responses carry the request id, so they
+    # may be written in completion order. The in-flight requests are answered
+    # before the server exits.
+    exit_code = 0
+    with ThreadPoolExecutor(max_workers=REQUEST_WORKERS, thread_name_prefix="mcp-request") as executor:
+        if not args.no_prefetch:
+            # Runs while we wait on stdin; a request arriving mid-prefetch joins
+            # the fetch already in flight instead of repeating it
+            executor.submit(prefetch, client)
+        while True:
+            try:
+                req = read_json()
+            except Exception as e:
+                logger.error("Error processing request: %s", e, exc_info=True)
+                exit_code = 1
+                break
+            if req is None:
+                break
+            executor.submit(process, req)
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
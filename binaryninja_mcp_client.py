@@ -7,15 +7,35 @@ The Binary Ninja MCP server is a plugin that provides an HTTP API for Binary Nin
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import logging
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+# orjson pretty-prints far faster than json's indent mode; it is optional
+try:
+    import orjson
+
+    def _pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    def _pretty(obj):
+        return json.dumps(obj, indent=2)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger('BinaryNinjaMCPClient')
 
+# Read-only responses remembered per client; cleared when the binary changes
+CACHE_SIZE = 256
+
+# Seconds a remembered response is reused; edits made in the Binary Ninja UI
+# (renames, retypes) are picked up once it runs out
+CACHE_TTL = 30.0
+
 class BinaryNinjaMCPClient:
     """Client for interacting with the Binary Ninja MCP server."""
     
@@ -23,7 +43,38 @@ class BinaryNinjaMCPClient:
         """Initialize the client with the server address."""
         self.base_url = f"http://{host}:{port}"
         self.session = requests.Session()
+        # A larger keep-alive pool for callers issuing requests in parallel
+        self.session.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=32))
+        self.session.headers['Connection'] = 'keep-alive'
+        self._cache = OrderedDict()
         logger.info(f"Initialized Binary Ninja MCP client for {self.base_url}")
+
+    def _cached_get(self, endpoint, params):
+        """GET a read-only endpoint, reusing the decoded response for identical params."""
+        key = (endpoint, tuple(sorted(params.items())))
+        response = self._recall(key)
+        if response is not None:
+            return response
+        response = self._request('GET', endpoint, params=params)
+        if not (isinstance(response, dict) and "error" in response):
+            self._remember(key, response)
+        return response
+
+    def _recall(self, key):
+        """Return the remembered value for key, or None once it is older than CACHE_TTL."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._cache.pop(key, None)
+            return None
+        self._cache.move_to_end(key)
+        return entry[1]
+
+    def _remember(self, key, value):
+        self._cache[key] = (time.monotonic() + CACHE_TTL, value)
+        if len(self._cache) > CACHE_SIZE:
+            self._cache.popitem(last=False)
         
     def _request(self, method, endpoint, data=None, params=None, timeout=60):
         """Make a request to the Binary Ninja MCP server."""
@@ -51,7 +102,7 @@ class BinaryNinjaMCPClient:
         except Exception as e:
             # If that fails, try a simple request to the root URL
             try:
-                response = requests.get(f"{self.base_url}/", timeout=5)
+                response = self.session.get(f"{self.base_url}/", timeout=5)
                 if response.status_code == 200 or response.status_code == 404:
                     # Even a 404 means the server is running
                     return {"status": "connected", "loaded": False}
@@ -67,6 +118,7 @@ class BinaryNinjaMCPClient:
         try:
             data = {"filepath": file_path}
             response = self._request('POST', 'load', data=data)
+            self._cache.clear()
             return response
         except Exception as e:
             logger.error(f"Failed to load file {file_path}: {e}")
@@ -85,7 +137,7 @@ class BinaryNinjaMCPClient:
         """List all functions in a binary file."""
         try:
             params = {"offset": offset, "limit": limit}
-            response = self._request('GET', 'functions', params=params)
+            response = self._cached_get('functions', params)
             return response.get("functions", [])
         except Exception as e:
             logger.error(f"Failed to list functions: {e}")
@@ -95,7 +147,7 @@ class BinaryNinjaMCPClient:
         """List all classes in a binary file."""
         try:
             params = {"offset": offset, "limit": limit}
-            response = self._request('GET', 'classes', params=params)
+            response = self._cached_get('classes', params)
             return response.get("classes", [])
         except Exception as e:
             logger.error(f"Failed to list classes: {e}")
@@ -105,7 +157,7 @@ class BinaryNinjaMCPClient:
         """List all segments in a binary file."""
         try:
             params = {"offset": offset, "limit": limit}
-            response = self._request('GET', 'segments', params=params)
+            response = self._cached_get('segments', params)
             return response.get("segments", [])
         except Exception as e:
             logger.error(f"Failed to list segments: {e}")
@@ -115,7 +167,7 @@ class BinaryNinjaMCPClient:
         """List all imported functions in a binary file."""
         try:
             params = {"offset": offset, "limit": limit}
-            response = self._request('GET', 'imports', params=params)
+            response = self._cached_get('imports', params)
             return response.get("imports", [])
         except Exception as e:
             logger.error(f"Failed to list imports: {e}")
@@ -125,7 +177,7 @@ class BinaryNinjaMCPClient:
         """List all exported symbols in a binary file."""
         try:
             params = {"offset": offset, "limit": limit}
-            response = self._request('GET', 'exports', params=params)
+            response = self._cached_get('exports', params)
             return response.get("exports", [])
         except Exception as e:
             logger.error(f"Failed to list exports: {e}")
@@ -135,7 +187,7 @@ class BinaryNinjaMCPClient:
         """List all namespaces in a binary file."""
         try:
             params = {"offset": offset, "limit": limit}
-            response = self._request('GET', 'namespaces', params=params)
+            response = self._cached_get('namespaces', params)
             return response.get("namespaces", [])
         except Exception as e:
             logger.error(f"Failed to list namespaces: {e}")
@@ -145,17 +197,64 @@ class BinaryNinjaMCPClient:
         """List all data variables in a binary file."""
         try:
             params = {"offset": offset, "limit": limit}
-            response = self._request('GET', 'data', params=params)
+            response = self._cached_get('data', params)
             return response.get("data", [])
         except Exception as e:
             logger.error(f"Failed to list data: {e}")
             raise
             
+    def list_all(self, endpoint, key, page=500, workers=8):
+        """Fetch every item of a paginated endpoint, requesting pages concurrently.
+
+        The first page is fetched alone. If the server reports a "total" the
+        remaining pages are requested in one parallel sweep; otherwise pages are
+        requested in rounds of `workers` until one comes back short.
+        """
+        cache_key = (endpoint, (("all", page),))
+        items = self._recall(cache_key)
+        if items is not None:
+            return items
+
+        def fetch(offset):
+            return self._request('GET', endpoint, params={"offset": offset, "limit": page})
+
+        try:
+            first = fetch(0)
+            items = list(first.get(key, []))
+            total = first.get("total")
+            if len(items) == page:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    if isinstance(total, int):
+                        for response in executor.map(fetch, range(page, total, page)):
+                            items.extend(response.get(key, []))
+                    else:
+                        offset = page
+                        done = False
+                        while not done:
+                            offsets = range(offset, offset + page * workers, page)
+                            for response in executor.map(fetch, offsets):
+                                batch = response.get(key, [])
+                                items.extend(batch)
+                                if len(batch) < page:
+                                    done = True
+                                    break
+                            offset += page * workers
+        except Exception as e:
+            logger.error(f"Failed to list all {key}: {e}")
+            raise
+
+        self._remember(cache_key, items)
+        return items
+
+    def list_all_functions(self, page=500, workers=8):
+        """List every function in the binary."""
+        return self.list_all('functions', 'functions', page=page, workers=workers)
+
     def search_functions(self, query, offset=0, limit=100):
         """Search for functions by name."""
         try:
             params = {"query": query, "offset": offset, "limit": limit}
-            response = self._request('GET', 'searchFunctions', params=params)
+            response = self._cached_get('searchFunctions', params)
             return response.get("matches", [])
         except Exception as e:
             logger.error(f"Failed to search functions: {e}")
@@ -165,7 +264,7 @@ class BinaryNinjaMCPClient:
         """Decompile a function by name."""
         try:
             params = {"name": function_name}
-            response = self._request('GET', 'decompile', params=params)
+            response = self._cached_get('decompile', params)
             return response
         except Exception as e:
             logger.error(f"Failed to decompile function {function_name}: {e}")
@@ -176,6 +275,7 @@ class BinaryNinjaMCPClient:
         try:
             data = {"oldName": old_name, "newName": new_name}
             response = self._request('POST', 'rename/function', data=data)
+            self._cache.clear()
             return response
         except Exception as e:
             logger.error(f"Failed to rename function {old_name} to {new_name}: {e}")
@@ -186,6 +286,7 @@ class BinaryNinjaMCPClient:
         try:
             data = {"address": address, "newName": new_name}
             response = self._request('POST', 'rename/data', data=data)
+            self._cache.clear()
             return response
         except Exception as e:
             logger.error(f"Failed to rename data at {address} to {new_name}: {e}")
@@ -211,7 +312,7 @@ if __name__ == "__main__":
             try:
                 print(f"\nLoading binary: {binary_path}")
                 load_result = client.load_binary(binary_path)
-                print(f"Load result: {json.dumps(load_result, indent=2)}")
+                print(f"Load result: {_pretty(load_result)}")
             except Exception as e:
                 print(f"Error loading binary: {e}")
                 sys.exit(1)
@@ -219,7 +320,7 @@ if __name__ == "__main__":
         # Get status
         try:
             status = client.get_status()
-            print(f"\nBinary status: {json.dumps(status, indent=2)}")
+            print(f"\nBinary status: {_pretty(status)}")
         except Exception as e:
             print(f"Error getting status: {e}")
         
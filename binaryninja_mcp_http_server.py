@@ -1,21 +1,57 @@
 #!/usr/bin/env python3
 import sys
 import json
-import traceback
 import os
 import logging
 import argparse
+import hashlib
+from operator import itemgetter
+import selectors
+import socket
 from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import urlparse
 import time
-from socketserver import ThreadingMixIn
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 # Assuming this is your BinaryNinja client implementation
 # You would need to adjust this import to match your actual implementation
-from binaryninja_http_client import BinaryNinjaHTTPClient
+from binaryninja_http_client import BinaryNinjaHTTPClient, ErrorText
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+# orjson encodes and decodes several times faster than json; it is optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+
+    def _json_text(obj):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def _json_pretty(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_text(obj):
+        return json.dumps(obj, separators=(',', ':'))
+
+    def _json_pretty(obj):
+        return json.dumps(obj, indent=2)
+
+    def _json_dumps(obj):
+        return _json_text(obj).encode('utf-8')
+
+# MessagePack is offered to clients that ask for it; also optional
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_TYPE = 'application/msgpack'
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("BinaryNinjaMCP")
 
 # Define the MCP tools - note the use of "path" instead of "file"
@@ -172,380 +208,750 @@ MCP_TOOLS = [
     }
 ]
 
-class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
-    daemon_threads = True
-
-class BinaryNinjaMCPHandler(BaseHTTPRequestHandler):
-    def __init__(self, *args, **kwargs):
-        self.client = BinaryNinjaHTTPClient()
+# GET responses that never change, encoded once at import
+_TOOL_LIST_BYTES = _json_dumps({
+    "jsonrpc": "2.0",
+    "id": "root-list",
+    "result": {
+        "name": "binaryninja-mcp",
+        "version": "0.1.0",
+        "tools": MCP_TOOLS
+    }
+})
+_PING_BYTES = _json_dumps({"status": "ok"})
+
+def _etag(body):
+    """Strong validator for a response body."""
+    return '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+
+_TOOL_LIST_ETAG = _etag(_TOOL_LIST_BYTES)
+# Result of the list_tools method; only the request id is spliced in per call
+_LIST_TOOLS_RESULT = {"tools": MCP_TOOLS}
+_TOOLS_RESULT_BYTES = _json_dumps(_LIST_TOOLS_RESULT)
+_NOT_FOUND_BYTES = _json_dumps({"error": "Not found"})
+
+_CORS_HEADERS = (b'Access-Control-Allow-Origin: *\r\n'
+                 b'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+                 b'Access-Control-Allow-Headers: Content-Type\r\n')
+
+def _head_bytes(protocol, status_code=200, content_type='application/json', length=None,
+                etag=None, extra=b''):
+    """Compose the status line and headers, through the blank line, as bytes."""
+    head = '%s %d %s\r\nContent-Type: %s\r\n' % (
+        protocol, status_code, BaseHTTPRequestHandler.responses[status_code][0], content_type)
+    if length is not None:
+        head += 'Content-Length: %d\r\n' % length
+    if etag is not None:
+        head += 'ETag: %s\r\n' % etag
+    return head.encode('latin-1') + extra + _CORS_HEADERS + b'\r\n'
+
+def _response_bytes(protocol, body, status_code=200, content_type='application/json', etag=None):
+    """Compose status line, headers and body into one buffer for a single write."""
+    return _head_bytes(protocol, status_code, content_type, len(body), etag) + body
+
+# Parameters each tool requires, all of them non-empty strings; taken from
+# the advertised schemas so the two cannot drift apart
+REQUIRED_PARAMS = {
+    tool["name"]: tuple(tool["inputSchema"].get("required", ()))
+    for tool in MCP_TOOLS
+}
+
+def _tuple_getter(keys):
+    # itemgetter returns a bare value for a single key; always hand back a tuple
+    getter = itemgetter(*keys)
+    if len(keys) == 1:
+        return lambda params: (getter(params),)
+    return getter
+
+# Fetch all of a tool's required parameters in one call for the fast validation path
+_REQUIRED_GETTERS = {name: _tuple_getter(keys) for name, keys in REQUIRED_PARAMS.items() if keys}
+
+# Read-only tools whose results are reused until a rename changes the binary
+CACHEABLE_METHODS = frozenset([
+    "get_binary_info", "list_functions", "disassemble_function", "decompile_function",
+    "get_function", "list_sections", "list_imports", "list_exports", "list_namespaces",
+    "list_data", "search_functions",
+])
+MUTATING_METHODS = frozenset(["rename_function", "rename_data"])
+
+# Cached tool results kept at once, and seconds each stays valid; the TTL
+# bounds staleness from edits made directly in the Binary Ninja UI
+RESPONSE_CACHE_SIZE = 512
+RESPONSE_CACHE_TTL = 30.0
+
+# Text results larger than this many characters are streamed in slices
+STREAM_THRESHOLD = 64 * 1024
+STREAM_CHUNK = 16 * 1024
+
+# Envelope of a successful single-text tool result, around the id and the
+# JSON-encoded text; matches what encoding the _wrap_result dict produces
+_TEXT_RESULT_HEAD = b'{"jsonrpc":"2.0","id":'
+_TEXT_RESULT_MID = b',"result":{"content":[{"type":"text","text":'
+_TEXT_RESULT_TAIL = b'}],"isError":false}}'
+
+def _result_text(response):
+    """Return the text of a successful single-text-content result, else None."""
+    result = response.get("result")
+    if not isinstance(result, dict) or result.get("isError") is not False:
+        return None
+    content = result.get("content")
+    if not isinstance(content, list) or len(content) != 1:
+        return None
+    text = content[0].get("text")
+    return text if isinstance(text, str) else None
+
+def _text_result_bytes(request_id, text):
+    """Encode a text result envelope, escaping only the id and the text."""
+    return (_TEXT_RESULT_HEAD + _json_dumps(request_id)
+            + _TEXT_RESULT_MID + _json_dumps(text) + _TEXT_RESULT_TAIL)
+
+# Tool calls inside one batch_call or JSON-RPC batch run concurrently on this pool
+BATCH_WORKERS = 8
+MAX_BATCH_CALLS = 64
+_BATCH_POOL = ThreadPoolExecutor(max_workers=BATCH_WORKERS, thread_name_prefix="mcp-batch")
+
+def _batch_map(fn, items):
+    """Map fn over items on _BATCH_POOL, keeping order.
+
+    A batch nested inside another (say a call_tool of batch_call in a JSON-RPC
+    batch) runs inline: waiting on the pool from one of its own workers could
+    deadlock once every worker is busy.
+    """
+    if threading.current_thread().name.startswith("mcp-batch"):
+        return [fn(item) for item in items]
+    return list(_BATCH_POOL.map(fn, items))
+
+class ResponseCache:
+    """Thread-safe TTL LRU of MCP "result" objects keyed by (method, params).
+
+    Results hold their tool payload already serialized, so a hit skips the
+    inner encode as well as the Binary Ninja round trip.
+    """
+
+    def __init__(self, maxsize=RESPONSE_CACHE_SIZE, ttl=RESPONSE_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.store = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.store.get(key)
+            if entry is None:
+                return None
+            expires, result = entry
+            if expires <= time.monotonic():
+                del self.store[key]
+                return None
+            self.store.move_to_end(key)
+            return result
+
+    def set(self, key, result):
+        with self.lock:
+            self.store[key] = (time.monotonic() + self.ttl, result)
+            self.store.move_to_end(key)
+            if len(self.store) > self.maxsize:
+                self.store.popitem(last=False)
+
+    def invalidate(self, path):
+        """Drop every cached result for the binary at path."""
+        with self.lock:
+            for key in [k for k in self.store if ("path", path) in k[1]]:
+                del self.store[key]
+
+    def clear(self):
+        with self.lock:
+            self.store.clear()
+
+# Seconds between heartbeats sent to SSE clients
+SSE_HEARTBEAT_INTERVAL = 10
+# Seconds a heartbeat write to an adopted SSE socket may block
+SSE_SEND_TIMEOUT = 5
+
+# Heartbeat event around its only varying field, the timestamp
+_HEARTBEAT_PREFIX = b'event: mcp-event\ndata: {"jsonrpc":"2.0","method":"heartbeat","params":{"timestamp":'
+_HEARTBEAT_SUFFIX = b'}}\n\n'
+
+def _heartbeat_message():
+    return b'%s%d%s' % (_HEARTBEAT_PREFIX, int(time.time()), _HEARTBEAT_SUFFIX)
+
+class HeartbeatTicker:
+    """One background thread that sends each SSE heartbeat to every subscriber.
+
+    Subscribers are connected sockets written with sendall: either one whose
+    handler thread blocks on the Event from subscribe(), or a detached one
+    adopted with adopt(). Adopted
+    sockets are watched with a selector so a client hanging up is noticed
+    between beats, and they cost no worker thread while idle.
+    """
+
+    def __init__(self, interval=SSE_HEARTBEAT_INTERVAL):
+        self.interval = interval
+        self.subscribers = {}
+        self.lock = threading.Lock()
+        self.thread = None
+        self.selector = selectors.DefaultSelector()
+        # Self-pipe that wakes the selector for new sockets and for stop()
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self.selector.register(self._wake_r, selectors.EVENT_READ)
+
+    def _start(self):
+        # Caller holds self.lock
+        if self.thread is None:
+            self.thread = threading.Thread(target=self._run, name="sse-heartbeat", daemon=True)
+            self.thread.start()
+
+    def subscribe(self, sock):
+        """Register a socket; the returned Event is set once writing to it fails."""
+        closed = threading.Event()
+        with self.lock:
+            self.subscribers[sock] = closed
+            self._start()
+        return closed
+
+    def adopt(self, sock):
+        """Take over a connected SSE socket; the ticker closes it when it drops."""
+        sock.settimeout(SSE_SEND_TIMEOUT)
+        with self.lock:
+            self.subscribers[sock] = None
+            self.selector.register(sock, selectors.EVENT_READ)
+            self._start()
+        self._wake_w.send(b"\0")
+
+    def _drop(self, stream):
+        with self.lock:
+            closed = self.subscribers.pop(stream, None)
+            if closed is None:
+                try:
+                    self.selector.unregister(stream)
+                except (KeyError, ValueError):
+                    pass
+        if closed is None:
+            stream.close()
+        else:
+            closed.set()
+
+    def _beat(self):
+        msg = _heartbeat_message()
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for stream in subscribers:
+            try:
+                stream.sendall(msg)
+            except Exception as e:
+                logger.warning(f"SSE error: {e}")
+                self._drop(stream)
+
+    def _run(self):
+        deadline = time.monotonic() + self.interval
+        # stop() clears self.thread, which ends this loop
+        while self.thread is threading.current_thread():
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                self._beat()
+                deadline += self.interval
+                continue
+            for key, _ in self.selector.select(timeout):
+                if key.fileobj is self._wake_r:
+                    try:
+                        self._wake_r.recv(64)
+                    except BlockingIOError:
+                        pass
+                    continue
+                # SSE clients never send; readable means EOF or an error
+                try:
+                    data = key.fileobj.recv(1024)
+                except OSError:
+                    data = b""
+                if not data:
+                    self._drop(key.fileobj)
+        with self.lock:
+            # A ticker restarted after stop() owns the current subscribers
+            subscribers = list(self.subscribers) if self.thread is None else []
+        for stream in subscribers:
+            self._drop(stream)
+
+    def stop(self):
+        """Stop the ticker, closing adopted sockets and releasing waiting handlers."""
+        with self.lock:
+            thread, self.thread = self.thread, None
+        self._wake_w.send(b"\0")
+        if thread is not None:
+            thread.join()
+
+_heartbeats = HeartbeatTicker()
+
+# Connections served at once; each open SSE stream holds one worker
+SERVER_WORKERS = 32
+# Seconds an idle keep-alive connection may hold a worker before it is closed
+KEEPALIVE_TIMEOUT = 15
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that hands connections to a fixed pool of warm worker threads."""
+    # socketserver's default listen backlog of 5 refuses connections when an
+    # agent fires a burst of parallel tool calls
+    request_queue_size = 128
+
+    def __init__(self, *args, max_workers=SERVER_WORKERS, client=None, sse_async=False, **kwargs):
         super().__init__(*args, **kwargs)
+        # Hand SSE connections to the heartbeat ticker instead of holding a worker
+        self.sse_async = sse_async
+        self._detached = set()
+        self._detached_lock = threading.Lock()
+        # Handlers are built per connection; the client lives here so its
+        # keep-alive session, caches and function index outlast them
+        self.client = client if client is not None else BinaryNinjaHTTPClient()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-http")
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self._serve, request, client_address)
+
+    def detach(self, request):
+        """Keep request's socket open after its handler returns."""
+        with self._detached_lock:
+            self._detached.add(request)
+
+    def _serve(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            with self._detached_lock:
+                detached = request in self._detached
+                self._detached.discard(request)
+            if not detached:
+                self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        _heartbeats.stop()
+        self._pool.shutdown(wait=False)
 
-    def _set_headers(self, content_type='application/json', status_code=200):
-        self.send_response(status_code)
-        self.send_header('Content-Type', content_type)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-        self.end_headers()
+class BinaryNinjaMCPHandler(BaseHTTPRequestHandler):
+    # Persistent connections let an agent's burst of calls share one socket;
+    # every response carries Content-Length or is chunked so this is safe
+    protocol_version = 'HTTP/1.1'
+    # An idle keep-alive connection gives its worker back after this long
+    timeout = KEEPALIVE_TIMEOUT
+    response_cache = ResponseCache()
+
+    @property
+    def client(self):
+        return self.server.client
+
+    def _send_body(self, body, status_code=200, content_type='application/json', etag=None):
+        """Send a complete response with one socket write."""
+        self.log_request(status_code)
+        self.wfile.write(_response_bytes(self.protocol_version, body, status_code, content_type, etag))
 
     def do_OPTIONS(self):
-        self._set_headers()
+        self._send_body(b'')
 
     def log_message(self, format, *args):
-        logger.info(format % args)
+        logger.info(format, *args)
 
     def do_GET(self):
-        logger.debug(f"GET request received: {self.path}")
-        logger.debug(f"Headers: {dict(self.headers)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GET request received: %s", self.path)
+            logger.debug("Headers: %s", self.headers)
         
-        parsed = urlparse(self.path)
-        if parsed.path == '/':
-            if 'text/event-stream' in self.headers.get('Accept', ''):
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/event-stream')
-                self.send_header('Cache-Control', 'no-cache')
-                self.send_header('Connection', 'keep-alive')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.end_headers()
-                try:
-                    logger.debug("Starting SSE connection")
-                    self.wfile.write(b"event: connected\ndata: {\"status\": \"ready\"}\n\n")
-                    self.wfile.flush()
-                    
-                    # Use a shorter heartbeat interval
-                    heartbeat_interval = 10  # seconds
-                    
-                    while True:
-                        heartbeat = {
-                            "jsonrpc": "2.0",
-                            "method": "heartbeat",
-                            "params": {"timestamp": int(time.time())}
-                        }
-                        msg = f"event: mcp-event\ndata: {json.dumps(heartbeat)}\n\n"
-                        logger.debug(f"Sending heartbeat: {msg}")
-                        self.wfile.write(msg.encode())
-                        self.wfile.flush()
-                        time.sleep(heartbeat_interval)
-                except Exception as e:
-                    logger.warning(f"SSE error: {e}")
-            else:
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": "root-list",
-                    "result": {
-                        "name": "binaryninja-mcp",
-                        "version": "0.1.0",
-                        "tools": MCP_TOOLS
-                    }
-                }
-                self._set_headers()
-                response_str = json.dumps(response)
-                logger.debug(f"Returning tool list: {response_str[:100]}...")
-                self.wfile.write(response_str.encode())
-        elif parsed.path == '/ping':
-            self._set_headers()
-            self.wfile.write(json.dumps({"status": "ok"}).encode())
+        route = self.path.partition('?')[0]
+        self._GET_ROUTES.get(route, BinaryNinjaMCPHandler._get_not_found)(self)
+
+    def _not_modified(self, etag):
+        """Answer a GET with 304 when the client already holds the body with this ETag."""
+        if self.headers.get('If-None-Match') != etag:
+            return False
+        self.send_response(304)
+        self.send_header('ETag', etag)
+        # The connection is kept alive, so even an empty reply states its length
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+        return True
+
+    def _get_root(self):
+        if 'text/event-stream' in self.headers.get('Accept', ''):
+            self.log_request(200)
+            # The stream never ends in a way that leaves the socket reusable
+            self.close_connection = True
+            try:
+                logger.debug("Starting SSE connection")
+                # Heartbeats are tiny and latency-sensitive; don't let Nagle hold them
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.connection.sendall(self._SSE_OPEN + _heartbeat_message())
+            except Exception as e:
+                logger.warning(f"SSE error: {e}")
+                return
+            # Later heartbeats come from the shared ticker. With --sse-async it
+            # owns the socket outright; otherwise this thread keeps the
+            # connection open until a write to it fails
+            if self.server.sse_async:
+                self.server.detach(self.connection)
+                _heartbeats.adopt(self.connection)
+                return
+            _heartbeats.subscribe(self.connection).wait()
         else:
-            self._set_headers(status_code=404)
-            self.wfile.write(json.dumps({"error": "Not found"}).encode())
+            if self._not_modified(_TOOL_LIST_ETAG):
+                return
+            logger.debug("Returning tool list")
+            self.log_request(200)
+            self.wfile.write(self._TOOL_LIST_RESPONSE)
+
+    def _get_ping(self):
+        self.log_request(200)
+        self.wfile.write(self._PING_RESPONSE)
+
+    def _get_not_found(self):
+        self._send_body(_NOT_FOUND_BYTES, status_code=404)
+
+    _GET_ROUTES = {'/': _get_root, '/ping': _get_ping}
+    # The static GET answers are complete responses down to the status line
+    _TOOL_LIST_RESPONSE = _response_bytes(protocol_version, _TOOL_LIST_BYTES, etag=_TOOL_LIST_ETAG)
+    _PING_RESPONSE = _response_bytes(protocol_version, _PING_BYTES)
+    # SSE headers plus the connected event; the first heartbeat is appended per stream
+    _SSE_OPEN = _head_bytes(protocol_version, content_type='text/event-stream',
+                            extra=b'Cache-Control: no-cache\r\nConnection: keep-alive\r\n') \
+        + b"event: connected\ndata: {\"status\": \"ready\"}\n\n"
 
     def do_POST(self):
         try:
             content_length = int(self.headers.get('Content-Length', 0))
-            raw_data = self.rfile.read(content_length).decode('utf-8')
+            raw_data = self._read_body(content_length)
             
-            logger.debug(f"POST received: {raw_data[:200]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("POST received: %s...", raw_data[:200])
             
-            request = json.loads(raw_data)
-            response = self._handle_mcp_request(request)
+            if MSGPACK_TYPE in self.headers.get('Content-Type', ''):
+                if msgpack is None:
+                    self._send_body(_json_dumps({"error": "MessagePack support is not installed"}),
+                                    status_code=415)
+                    return
+                request = msgpack.unpackb(raw_data)
+            else:
+                request = _json_loads(raw_data)
+            method = request.get("method") if isinstance(request, dict) else None
+            if method == "list_tools" and MSGPACK_TYPE not in self.headers.get('Accept', ''):
+                self._send_body(b'{"jsonrpc":"2.0","id":' + _json_dumps(request.get("id"))
+                                + b',"result":' + _TOOLS_RESULT_BYTES + b'}')
+                return
+            if isinstance(request, list):
+                response = self._handle_batch(request)
+            else:
+                response = self._handle_mcp_request(request)
             
-            self._set_headers()
-            response_str = json.dumps(response)
-            logger.debug(f"Responding with: {response_str[:200]}...")
-            self.wfile.write(response_str.encode())
+            # Answer in MessagePack only when the client accepts it
+            etag = None
+            content_type = 'application/json'
+            if msgpack is not None and MSGPACK_TYPE in self.headers.get('Accept', ''):
+                content_type = MSGPACK_TYPE
+                body = msgpack.packb(response)
+            else:
+                text = _result_text(response) if isinstance(response, dict) else None
+                if text is not None and len(text) > STREAM_THRESHOLD:
+                    self.log_request(200)
+                    self._write_streamed_text(response["id"], text)
+                    return
+                if text is not None:
+                    body = _text_result_bytes(response["id"], text)
+                else:
+                    body = _json_dumps(response)
+                if method in CACHEABLE_METHODS and "result" in response:
+                    # The validator covers the result alone, so it stays the same
+                    # across request ids and a client can tell an unchanged
+                    # result apart. POSTs are always answered in full: any
+                    # conditional status would reach JSON-RPC clients as an error
+                    etag = _etag(text.encode('utf-8') if text is not None else _json_dumps(response["result"]))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Responding with: %s...", body[:200])
+            self._send_body(body, content_type=content_type, etag=etag)
         except Exception as e:
-            logger.error(f"POST error: {e}")
-            logger.error(traceback.format_exc())
-            self._set_headers(status_code=500)
-            self.wfile.write(json.dumps({
+            logger.exception("POST error: %s", e)
+            self._send_body(_json_dumps({
                 "jsonrpc": "2.0",
                 "id": None,
                 "error": {"code": -32603, "message": str(e)}
-            }).encode())
-
-    def _wrap_result(self, request_id, text):
+            }), status_code=500)
+
+    def _read_body(self, length):
+        """Read exactly length bytes (fewer at EOF) straight into one buffer.
+
+        Both JSON decoders and msgpack take the bytearray as is, so the body
+        is never copied into an intermediate bytes object.
+        """
+        body = bytearray(length)
+        view = memoryview(body)
+        offset = 0
+        while offset < length:
+            n = self.rfile.readinto(view[offset:])
+            if not n:
+                break
+            offset += n
+        view.release()
+        if offset < length:
+            del body[offset:]
+        return body
+
+    def _write_streamed_text(self, request_id, text):
+        """Write a large text result without encoding the whole envelope in memory.
+
+        The envelope is written around the text, which is JSON-escaped and sent
+        in STREAM_CHUNK slices; escaping is per character, so the slices join
+        into the same document a single encode would produce. The body goes
+        out with chunked transfer encoding so the connection stays reusable;
+        headers ride with the first chunk and the terminating chunk with the
+        last, so there is one write per slice.
+        """
+        head = _head_bytes(self.protocol_version, extra=b'Transfer-Encoding: chunked\r\n')
+        out = _TEXT_RESULT_HEAD + _json_dumps(request_id) + _TEXT_RESULT_MID + b'"'
+        for start in range(0, len(text), STREAM_CHUNK):
+            out += _json_dumps(text[start:start + STREAM_CHUNK])[1:-1]
+            if start + STREAM_CHUNK < len(text):
+                self.wfile.write(head + b'%x\r\n%s\r\n' % (len(out), out))
+                head = out = b''
+        out += b'"' + _TEXT_RESULT_TAIL
+        self.wfile.write(head + b'%x\r\n%s\r\n0\r\n\r\n' % (len(out), out))
+
+    def _wrap_result(self, request_id, text, is_error=False):
         return {
             "jsonrpc": "2.0",
             "id": request_id,
             "result": {
                 "content": [{"type": "text", "text": text}],
-                "isError": False
+                "isError": is_error
             }
         }
 
-    def _handle_mcp_request(self, request):
-        request_id = request.get("id")
-        method = request.get("method")
-        params = request.get("params", {})
+    def _handle_batch(self, requests):
+        """Answer a JSON-RPC 2.0 batch: an array of requests in, an array of responses out.
 
-        logger.debug(f"Handling MCP request: id={request_id}, method={method}, params={params}")
+        Members run concurrently and independently; identical backend reads
+        among them are still coalesced by the client's single-flight GETs.
+        """
+        if not requests:
+            return self._error_response(None, -32600, "Empty batch")
+        if len(requests) > MAX_BATCH_CALLS:
+            return self._error_response(None, -32600, f"At most {MAX_BATCH_CALLS} requests per batch")
+        return _batch_map(self._handle_batch_member, requests)
 
-        try:
-            if method == "list_tools":
-                return {
-                    "jsonrpc": "2.0", "id": request_id,
-                    "result": {"tools": MCP_TOOLS}
-                }
-            elif method == "call_tool":
-                name = params.get("name")
-                args = params.get("arguments", {})
-                return self._handle_mcp_request({"jsonrpc": "2.0", "id": request_id, "method": name, "params": args})
-
-            elif method == "get_binary_info":
-                path = params.get("path")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                
-                logger.debug(f"Getting info for file: {path}")
-                info = self.client.get_file_info(path)
-                return self._wrap_result(request_id, json.dumps(info, indent=2))
-
-            elif method == "list_functions":
-                path = params.get("path")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                
-                logger.debug(f"Listing functions for file: {path}")
-                funcs = self.client.list_functions(path)
-                return self._wrap_result(request_id, json.dumps([f["name"] for f in funcs], indent=2))
-
-            elif method == "disassemble_function":
-                path = params.get("path")
-                func = params.get("function")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not func:
-                    logger.error("Missing 'function' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'function' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                if not isinstance(func, str):
-                    logger.error(f"Invalid function type: {type(func)}")
-                    return self._error_response(request_id, -32602, "Parameter 'function' must be a string")
-                
-                logger.debug(f"Disassembling function {func} in file: {path}")
-                code = self.client.get_disassembly(path, function_name=func)
-                return self._wrap_result(request_id, "\n".join(code))
-
-            elif method == "decompile_function":
-                path = params.get("path")
-                func = params.get("function")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not func:
-                    logger.error("Missing 'function' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'function' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                if not isinstance(func, str):
-                    logger.error(f"Invalid function type: {type(func)}")
-                    return self._error_response(request_id, -32602, "Parameter 'function' must be a string")
-                
-                logger.debug(f"Decompiling function {func} in file: {path}")
-                hlil = self.client.get_hlil(path, function_name=func)
-                return self._wrap_result(request_id, "\n".join(hlil) if isinstance(hlil, list) else str(hlil))
-
-            elif method == "get_function":
-                path = params.get("path")
-                func = params.get("function")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not func:
-                    logger.error("Missing 'function' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'function' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                if not isinstance(func, str):
-                    logger.error(f"Invalid function type: {type(func)}")
-                    return self._error_response(request_id, -32602, "Parameter 'function' must be a string")
-                
-                logger.debug(f"Getting function info for {func} in file: {path}")
-                func_info = self.client.get_function(path, function_name=func)
-                if func_info:
-                    return self._wrap_result(request_id, json.dumps(func_info, indent=2))
-                else:
-                    return self._error_response(request_id, -32602, f"Function '{func}' not found")
-
-            elif method == "list_sections":
-                path = params.get("path")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                
-                logger.debug(f"Listing sections for file: {path}")
-                sections = self.client.get_sections(path)
-                return self._wrap_result(request_id, json.dumps(sections, indent=2))
-
-            elif method == "list_imports":
-                path = params.get("path")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                
-                logger.debug(f"Listing imports for file: {path}")
-                imports = self.client.get_imports()
-                return self._wrap_result(request_id, json.dumps(imports, indent=2))
-
-            elif method == "list_exports":
-                path = params.get("path")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                
-                logger.debug(f"Listing exports for file: {path}")
-                exports = self.client.get_exports()
-                return self._wrap_result(request_id, json.dumps(exports, indent=2))
-
-            elif method == "list_namespaces":
-                path = params.get("path")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                
-                logger.debug(f"Listing namespaces for file: {path}")
-                namespaces = self.client.get_namespaces()
-                return self._wrap_result(request_id, json.dumps(namespaces, indent=2))
-
-            elif method == "list_data":
-                path = params.get("path")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                
-                logger.debug(f"Listing data variables for file: {path}")
-                data_items = self.client.get_defined_data()
-                return self._wrap_result(request_id, json.dumps(data_items, indent=2))
-
-            elif method == "search_functions":
-                path = params.get("path")
-                query = params.get("query")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not query:
-                    logger.error("Missing 'query' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'query' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                if not isinstance(query, str):
-                    logger.error(f"Invalid query type: {type(query)}")
-                    return self._error_response(request_id, -32602, "Parameter 'query' must be a string")
-                
-                logger.debug(f"Searching functions with query '{query}' in file: {path}")
-                matches = self.client.search_functions(query)
-                return self._wrap_result(request_id, json.dumps(matches, indent=2))
-
-            elif method == "rename_function":
-                path = params.get("path")
-                old_name = params.get("old_name")
-                new_name = params.get("new_name")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not old_name:
-                    logger.error("Missing 'old_name' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'old_name' parameter")
-                if not new_name:
-                    logger.error("Missing 'new_name' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'new_name' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                if not isinstance(old_name, str):
-                    logger.error(f"Invalid old_name type: {type(old_name)}")
-                    return self._error_response(request_id, -32602, "Parameter 'old_name' must be a string")
-                if not isinstance(new_name, str):
-                    logger.error(f"Invalid new_name type: {type(new_name)}")
-                    return self._error_response(request_id, -32602, "Parameter 'new_name' must be a string")
-                
-                logger.debug(f"Renaming function from '{old_name}' to '{new_name}' in file: {path}")
-                success = self.client.rename_function(old_name, new_name)
-                if success:
-                    return self._wrap_result(request_id, json.dumps({"success": True, "message": f"Function renamed from '{old_name}' to '{new_name}'"}, indent=2))
-                else:
-                    return self._error_response(request_id, -32602, f"Failed to rename function '{old_name}' to '{new_name}'")
-
-            elif method == "rename_data":
-                path = params.get("path")
-                address = params.get("address")
-                new_name = params.get("new_name")
-                if not path:
-                    logger.error("Missing 'path' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'path' parameter")
-                if not address:
-                    logger.error("Missing 'address' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'address' parameter")
-                if not new_name:
-                    logger.error("Missing 'new_name' parameter")
-                    return self._error_response(request_id, -32602, "Missing 'new_name' parameter")
-                if not isinstance(path, str):
-                    logger.error(f"Invalid path type: {type(path)}")
-                    return self._error_response(request_id, -32602, "Parameter 'path' must be a string")
-                if not isinstance(address, str):
-                    logger.error(f"Invalid address type: {type(address)}")
-                    return self._error_response(request_id, -32602, "Parameter 'address' must be a string")
-                if not isinstance(new_name, str):
-                    logger.error(f"Invalid new_name type: {type(new_name)}")
-                    return self._error_response(request_id, -32602, "Parameter 'new_name' must be a string")
-                
-                logger.debug(f"Renaming data at address '{address}' to '{new_name}' in file: {path}")
-                success = self.client.rename_data(address, new_name)
-                if success:
-                    return self._wrap_result(request_id, json.dumps({"success": True, "message": f"Data at address '{address}' renamed to '{new_name}'"}, indent=2))
+    def _handle_batch_member(self, request):
+        if not isinstance(request, dict):
+            return self._error_response(None, -32600, "Invalid Request")
+        return self._handle_mcp_request(request)
+
+    def _handle_mcp_request(self, request):
+        return self._handle_call(request.get("id"), request.get("method"), request.get("params", {}))
+
+    def _handle_call(self, request_id, method, params):
+        """Answer read-only tools from the response cache, otherwise dispatch."""
+
+        cache_key = None
+        if method in CACHEABLE_METHODS and isinstance(params, dict):
+            try:
+                cache_key = (method, frozenset(params.items()))
+            except TypeError:
+                # Unhashable argument values; just don't cache this call
+                cache_key = None
+        if cache_key is not None:
+            result = self.response_cache.get(cache_key)
+            if result is not None:
+                return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+        response = self._dispatch_mcp_request(request_id, method, params)
+        if "result" in response:
+            if cache_key is not None:
+                # Failures (e.g. a brief backend outage) are answered but not kept
+                result = response["result"]
+                if isinstance(result, dict) and result.get("isError"):
+                    return response
+                self.response_cache.set(cache_key, response["result"])
+            elif method in MUTATING_METHODS:
+                path = params.get("path") if isinstance(params, dict) else None
+                if isinstance(path, str):
+                    self.response_cache.invalidate(path)
                 else:
-                    return self._error_response(request_id, -32602, f"Failed to rename data at address '{address}' to '{new_name}'")
+                    self.response_cache.clear()
+        return response
 
-            elif method == "cancel":
-                logger.debug("Cancel requested — not implemented.")
-                return self._error_response(request_id, -32601, "Cancel not implemented")
+    def _dispatch_mcp_request(self, request_id, method, params):
+        logger.debug("Handling MCP request: id=%s, method=%s, params=%s", request_id, method, params)
 
-            logger.error(f"Unknown method: {method}")
-            return self._error_response(request_id, -32601, f"Unknown method: {method}")
+        try:
+            getter = _REQUIRED_GETTERS.get(method)
+            if getter is not None:
+                try:
+                    valid = all(type(v) is str and v for v in getter(params))
+                except (KeyError, TypeError):
+                    valid = False
+                if not valid:
+                    # Slow path only to name the offending parameter
+                    error = self._validate_params(request_id, params, REQUIRED_PARAMS[method])
+                    if error:
+                        return error
+
+            handler = self._HANDLERS.get(method)
+            if handler is None:
+                logger.error("Unknown method: %s", method)
+                return self._error_response(request_id, -32601, f"Unknown method: {method}")
+            return handler(self, request_id, params)
 
         except Exception as e:
-            logger.error(f"Error in MCP handler: {e}\n{traceback.format_exc()}")
+            logger.exception("Error in MCP handler: %s", e)
             return self._error_response(request_id, -32603, str(e))
 
+    def _h_list_tools(self, request_id, params):
+        return {"jsonrpc": "2.0", "id": request_id, "result": _LIST_TOOLS_RESULT}
+
+    def _h_call_tool(self, request_id, params):
+        return self._handle_call(request_id, params.get("name"), params.get("arguments", {}))
+
+    def _h_batch_call(self, request_id, params):
+        calls = params.get("calls")
+        if not isinstance(calls, list):
+            return self._error_response(request_id, -32602, "Parameter 'calls' must be a list")
+        if len(calls) > MAX_BATCH_CALLS:
+            return self._error_response(request_id, -32602, f"At most {MAX_BATCH_CALLS} calls per batch")
+        if any(not isinstance(c, dict) or c.get("name") == "batch_call" for c in calls):
+            return self._error_response(request_id, -32602, "Each call must be a {name, arguments} object other than batch_call")
+
+        def run(call):
+            response = self._handle_call(request_id, call.get("name"), call.get("arguments", {}))
+            if "error" in response:
+                return {"error": response["error"]}
+            return {"result": response.get("result")}
+
+        return {
+            "jsonrpc": "2.0", "id": request_id,
+            "result": {"responses": _batch_map(run, calls)}
+        }
+
+    def _h_get_binary_info(self, request_id, params):
+        path = params.get("path")
+        logger.debug("Getting info for file: %s", path)
+        info = self.client.get_file_info(path)
+        return self._wrap_result(request_id, _json_text(info))
+
+    def _h_list_functions(self, request_id, params):
+        path = params.get("path")
+        logger.debug("Listing functions for file: %s", path)
+        funcs = self.client.list_functions(path)
+        return self._wrap_result(request_id, _json_text([f["name"] for f in funcs]))
+
+    def _h_disassemble_function(self, request_id, params):
+        path = params.get("path")
+        func = params.get("function")
+        logger.debug("Disassembling function %s in file: %s", func, path)
+        code = self.client.get_disassembly(path, function_name=func)
+        failed = any(isinstance(line, ErrorText) for line in code)
+        return self._wrap_result(request_id, "\n".join(code), is_error=failed)
+
+    def _h_decompile_function(self, request_id, params):
+        path = params.get("path")
+        func = params.get("function")
+        logger.debug("Decompiling function %s in file: %s", func, path)
+        hlil = self.client.get_hlil(path, function_name=func)
+        return self._wrap_result(request_id, hlil if isinstance(hlil, str) else "\n".join(hlil),
+                                 is_error=isinstance(hlil, ErrorText))
+
+    def _h_get_function(self, request_id, params):
+        path = params.get("path")
+        func = params.get("function")
+        logger.debug("Getting function info for %s in file: %s", func, path)
+        func_info = self.client.get_function(path, function_name=func)
+        if func_info:
+            return self._wrap_result(request_id, _json_text(func_info))
+        return self._error_response(request_id, -32602, f"Function '{func}' not found")
+
+    def _h_list_sections(self, request_id, params):
+        path = params.get("path")
+        logger.debug("Listing sections for file: %s", path)
+        sections = self.client.get_sections(path)
+        return self._wrap_result(request_id, _json_text(sections))
+
+    def _h_list_imports(self, request_id, params):
+        logger.debug("Listing imports for file: %s", params.get("path"))
+        return self._wrap_result(request_id, _json_text(self.client.get_imports()))
+
+    def _h_list_exports(self, request_id, params):
+        logger.debug("Listing exports for file: %s", params.get("path"))
+        return self._wrap_result(request_id, _json_text(self.client.get_exports()))
+
+    def _h_list_namespaces(self, request_id, params):
+        logger.debug("Listing namespaces for file: %s", params.get("path"))
+        return self._wrap_result(request_id, _json_text(self.client.get_namespaces()))
+
+    def _h_list_data(self, request_id, params):
+        logger.debug("Listing data variables for file: %s", params.get("path"))
+        return self._wrap_result(request_id, _json_text(self.client.get_defined_data()))
+
+    def _h_search_functions(self, request_id, params):
+        path = params.get("path")
+        query = params.get("query")
+        logger.debug("Searching functions with query '%s' in file: %s", query, path)
+        matches = self.client.search_functions(query)
+        return self._wrap_result(request_id, _json_text(matches))
+
+    def _h_rename_function(self, request_id, params):
+        path = params.get("path")
+        old_name = params.get("old_name")
+        new_name = params.get("new_name")
+        logger.debug("Renaming function from '%s' to '%s' in file: %s", old_name, new_name, path)
+        if self.client.rename_function(old_name, new_name):
+            return self._wrap_result(request_id, _json_text({"success": True, "message": f"Function renamed from '{old_name}' to '{new_name}'"}))
+        return self._error_response(request_id, -32602, f"Failed to rename function '{old_name}' to '{new_name}'")
+
+    def _h_rename_data(self, request_id, params):
+        path = params.get("path")
+        address = params.get("address")
+        new_name = params.get("new_name")
+        logger.debug("Renaming data at address '%s' to '%s' in file: %s", address, new_name, path)
+        if self.client.rename_data(address, new_name):
+            return self._wrap_result(request_id, _json_text({"success": True, "message": f"Data at address '{address}' renamed to '{new_name}'"}))
+        return self._error_response(request_id, -32602, f"Failed to rename data at address '{address}' to '{new_name}'")
+
+    def _h_cancel(self, request_id, params):
+        logger.debug("Cancel requested — not implemented.")
+        return self._error_response(request_id, -32601, "Cancel not implemented")
+
+    # Method name -> handler; built once for the class since a handler
+    # instance is created for every connection
+    _HANDLERS = {
+        "list_tools": _h_list_tools,
+        "call_tool": _h_call_tool,
+        "batch_call": _h_batch_call,
+        "get_binary_info": _h_get_binary_info,
+        "list_functions": _h_list_functions,
+        "disassemble_function": _h_disassemble_function,
+        "decompile_function": _h_decompile_function,
+        "get_function": _h_get_function,
+        "list_sections": _h_list_sections,
+        "list_imports": _h_list_imports,
+        "list_exports": _h_list_exports,
+        "list_namespaces": _h_list_namespaces,
+        "list_data": _h_list_data,
+        "search_functions": _h_search_functions,
+        "rename_function": _h_rename_function,
+        "rename_data": _h_rename_data,
+        "cancel": _h_cancel,
+    }
+
+    def _validate_params(self, request_id, params, required):
+        """Return an error response unless every required parameter is a non-empty string."""
+        if not isinstance(params, dict):
+            logger.error("Invalid params type: %s", type(params))
+            return self._error_response(request_id, -32602, "params must be an object")
+        for key in required:
+            value = params.get(key)
+            if isinstance(value, str) and value:
+                continue
+            if not value:
+                logger.error("Missing '%s' parameter", key)
+                return self._error_response(request_id, -32602, f"Missing '{key}' parameter")
+            logger.error("Invalid %s type: %s", key, type(value))
+            return self._error_response(request_id, -32602, f"Parameter '{key}' must be a string")
+        return None
+
     def _error_response(self, request_id, code, message):
         return {
             "jsonrpc": "2.0",
@@ -556,8 +962,8 @@ class BinaryNinjaMCPHandler(BaseHTTPRequestHandler):
             }
         }
 
-def run_server(host='127.0.0.1', port=8088):
-    server = ThreadedHTTPServer((host, port), BinaryNinjaMCPHandler)
+def run_server(host='127.0.0.1', port=8088, workers=SERVER_WORKERS, sse_async=False):
+    server = PooledHTTPServer((host, port), BinaryNinjaMCPHandler, max_workers=workers, sse_async=sse_async)
     logger.info(f"Binary Ninja MCP HTTP server running at http://{host}:{port}")
     server.serve_forever()
 
@@ -565,8 +971,22 @@ def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--host', default='127.0.0.1')
     parser.add_argument('--port', type=int, default=8088)
+    parser.add_argument('--workers', type=int, default=SERVER_WORKERS,
+                        help='connections served concurrently (default: %(default)s)')
+    parser.add_argument('--sse-async', action='store_true',
+                        help='serve idle SSE streams from the heartbeat thread, not a worker each')
+    parser.add_argument('--debug', action='store_true',
+                        help='log request and response previews')
+    parser.add_argument('--pretty', action='store_true',
+                        help='indent the JSON inside tool results, for reading by eye')
     args = parser.parse_args()
-    run_server(args.host, args.port)
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    if args.pretty:
+        # Tool payloads are compact by default; the model reading them doesn't need indentation
+        global _json_text
+        _json_text = _json_pretty
+    run_server(args.host, args.port, args.workers, args.sse_async)
 
 if __name__ == '__main__':
     main()
@@ -2,9 +2,31 @@
 from __future__ import annotations
 import json
 import time
+import binascii
+import functools
+import heapq
+import random
 import logging
-from typing import Any, Dict, List, Optional, Tuple
-import requests
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+import urllib3
+
+# orjson decodes and encodes the bridge payloads several times faster; optional
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_text(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_text(obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
 
 # Set up logging to help debug connection issues
 logging.basicConfig(level=logging.INFO)
@@ -16,11 +38,29 @@ logger = logging.getLogger(__name__)
 BINJA_URL = "http://localhost:9009"
 CONNECT_TIMEOUT = 1.0
 READ_TIMEOUT = 8.0
+# (connect, read) per endpoint; anything unlisted uses the defaults above
+TIMEOUTS: Dict[str, Tuple[float, float]] = {
+    "status": (1.0, 2.0),
+    "binary": (1.0, 2.0),
+    "decompile": (1.0, 30.0),
+    "function/callers": (1.0, 15.0),
+    "data/references": (1.0, 15.0),
+}
+# Wall-clock cap on the whole body for endpoints whose responses are streamed
+TOTAL_TIMEOUTS: Dict[str, float] = {
+    "decompile": 60.0,
+}
 MAX_RETRIES = 2
 RETRY_BACKOFF_BASE = 0.2  # seconds
+RETRY_BACKOFF_MAX = 2.0   # seconds
 DEFAULT_LIMIT = 100
 MAX_LIMIT = 1000   # protect the UI & SSE
 CACHE_TTL = 3.0   # seconds for volatile lists
+CACHE_MAX_ENTRIES = 1024  # distinct cached list requests kept at once
+ERROR_CACHE_TTL = 0.2     # seconds an error envelope is reused (plus jitter)
+STATIC_CACHE_TTL = 60.0   # seconds for overview/binary, which change with the binary
+HEALTH_CACHE_TTL = 1.0    # seconds for the health probe agents poll
+DECOMPILE_CACHE_TTL = 10.0  # seconds for decompilations, which UI renames/retypes change
 
 # ──────────────────────────────────────────────────────────────────────────────
 # MCP app (synchronous)
@@ -29,6 +69,26 @@ from fastmcp import FastMCP
 
 mcp = FastMCP("binja-mcp")
 
+# One keep-alive connection pool for every call, used through urllib3 directly
+# since requests' per-call session/prepare layer outweighs a loopback round-trip.
+# Retries are done in _request so they keep their backoff; the pool is safe to
+# share between the threads FastMCP may dispatch tools on. Compressed bodies
+# are decompressed transparently as they are read.
+_POOL = urllib3.PoolManager(
+    num_pools=1,
+    maxsize=32,
+    retries=False,
+    headers={
+        "Accept-Encoding": "gzip, deflate",
+        "Connection": "keep-alive",
+    },
+)
+# Merged over the pool defaults, which urllib3 drops when headers are passed
+_FORM_HEADERS = {**_POOL.headers, "Content-Type": "application/x-www-form-urlencoded"}
+
+# Returned as the data of a conditional request the server answered with 304
+NOT_MODIFIED = object()
+
 def _now() -> float:
     return time.monotonic()
 
@@ -36,71 +96,271 @@ def _request(
     method: str,
     endpoint: str,
     *,
-    params: Dict[str, Any] | None = None,
+    params: Mapping[str, Any] | None = None,
     data: Dict[str, Any] | str | None = None,
+    validators: Mapping[str, str] | None = None,
+    meta: Dict[str, str] | None = None,
 ) -> Tuple[Optional[Any], Optional[str]]:
-    """Wrapped request with retries and error handling."""
-    session = requests.Session()
-    session.timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    """Wrapped request with retries and error handling.
+
+    validators ({"ETag": ..., "Last-Modified": ...} from an earlier response)
+    make a GET conditional; a 304 then returns NOT_MODIFIED as the data. The
+    response's own validators are copied into meta when it is given.
+    """
+    connect, read = TIMEOUTS.get(endpoint, (CONNECT_TIMEOUT, READ_TIMEOUT))
+    timeout = urllib3.Timeout(connect=connect, read=read)
+    total = TOTAL_TIMEOUTS.get(endpoint)
+    # Streamed only when the body has a wall-clock cap; otherwise urllib3
+    # reads the whole body in one call
+    preload = total is None
+    headers = _FORM_HEADERS if isinstance(data, dict) else None
+    body = urlencode(data) if isinstance(data, dict) else data
+    conditional = _conditional_headers(validators) if validators else None
 
     last_err = None
     for attempt in range(MAX_RETRIES + 1):
         try:
             url = f"{BINJA_URL}/{endpoint}"
+            started = _now()
             if method == "GET":
-                r = session.get(url, params=params)
+                r = _POOL.request("GET", url, fields=params, headers=conditional, timeout=timeout, preload_content=preload)
             else:
-                r = session.post(url, data=data)
-
-            if 200 <= r.status_code < 300:
-                # Try JSON; fall back to text split-lines
-                try:
-                    return r.json(), None
-                except json.JSONDecodeError:
-                    txt = r.text.strip()
-                    if txt.startswith("{") or txt.startswith("["):
-                        return json.loads(txt), None
-                    return txt.splitlines(), None
-            return None, f"{r.status_code} {r.reason}"
+                r = _POOL.request(method, url, body=body, headers=headers, timeout=timeout, preload_content=preload)
+
+            if meta is not None:
+                for name in ("ETag", "Last-Modified"):
+                    value = r.headers.get(name)
+                    if value:
+                        meta[name] = value
+            if r.status == 304:
+                if not preload:
+                    r.release_conn()
+                return NOT_MODIFIED, None
+            if 200 <= r.status < 300:
+                if preload:
+                    content = r.data
+                else:
+                    content = _read_within(r, started + total)
+                    if content is None:
+                        return None, f"{endpoint} exceeded {total:g}s"
+                return _parse_body(r, content), None
+            if not preload:
+                r.release_conn()
+            return None, f"{r.status} {r.reason}"
         except Exception as e:
             last_err = str(e)
             if attempt < MAX_RETRIES:
-                time.sleep(RETRY_BACKOFF_BASE * (attempt + 1))
+                # Exponential backoff with jitter, so retries do not synchronize
+                time.sleep(min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * (2 ** attempt)) * (0.5 + random.random()))
             logger.warning(f"Request attempt {attempt + 1} failed: {last_err}")
     return None, last_err or "unknown error"
 
+def _conditional_headers(validators: Mapping[str, str]) -> Dict[str, str]:
+    # urllib3 sends the pool's default headers only when a request passes
+    # none, so the conditional ones are merged over them
+    headers = dict(_POOL.headers)
+    if validators.get("ETag"):
+        headers["If-None-Match"] = validators["ETag"]
+    if validators.get("Last-Modified"):
+        headers["If-Modified-Since"] = validators["Last-Modified"]
+    return headers
+
+def _read_within(r: urllib3.HTTPResponse, deadline: float) -> Optional[bytes]:
+    """Read a streamed body, giving up (and dropping the connection) past deadline."""
+    chunks = []
+    for chunk in r.stream(65536):
+        chunks.append(chunk)
+        if _now() > deadline:
+            r.close()
+            return None
+    # Reading to EOF hands the connection back to the pool
+    return b"".join(chunks)
+
+def _charset(r: urllib3.HTTPResponse) -> str:
+    """Charset named in the response's Content-Type, defaulting to UTF-8."""
+    content_type = r.headers.get("Content-Type", "")
+    _, _, charset = content_type.partition("charset=")
+    return charset.split(";", 1)[0].strip().strip('"') or "utf-8"
+
+def _parse_body(r: urllib3.HTTPResponse, content: bytes) -> Any:
+    """Decode a response body as JSON, falling back to its text lines."""
+    try:
+        return _json_loads(content)
+    except ValueError:
+        # Not JSON, so a second parse attempt cannot succeed; decode once
+        # and split into lines
+        try:
+            txt = content.strip().decode(_charset(r), errors="replace")
+        except LookupError:
+            txt = content.strip().decode("utf-8", errors="replace")
+        return txt.splitlines()
+
 def _clamp_paging(offset: int | None, limit: int | None) -> Tuple[int, int]:
-    o = max(0, int(offset or 0))
-    l = min(MAX_LIMIT, max(1, int(limit or DEFAULT_LIMIT)))
+    # Plain comparisons; int() only runs for the rare None/str/float argument
+    if type(offset) is not int:
+        offset = int(offset or 0)
+    if type(limit) is not int or not limit:
+        limit = int(limit or DEFAULT_LIMIT)
+    o = offset if offset > 0 else 0
+    l = MAX_LIMIT if limit > MAX_LIMIT else (limit if limit > 0 else 1)
     return o, l
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Simple TTL cache for volatile list endpoints
 # ──────────────────────────────────────────────────────────────────────────────
 class TTLCache:
-    def __init__(self, ttl: float):
-        self.ttl = ttl
-        self.store: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, Any]] = {}
+    """Thread-safe TTL cache, bounded by LRU eviction.
 
-    def _key(self, name: str, params: Dict[str, Any]) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
-        return (name, tuple(sorted(params.items())))
+    An entry is fresh for ttl seconds and is then kept as stale for another
+    stale_ttl seconds, so callers can serve it while refreshing. Expiry times
+    also go on a heap, so every access sweeps out entries that have expired
+    even if their keys are never requested again.
+    """
 
-    def get(self, name: str, params: Dict[str, Any]) -> Optional[Any]:
+    def __init__(self, ttl: float, max_entries: int = CACHE_MAX_ENTRIES, stale_ttl: float | None = None):
+        self.ttl = ttl
+        self.stale_ttl = ttl if stale_ttl is None else stale_ttl
+        self.max_entries = max_entries
+        self.store: OrderedDict[Tuple[str, FrozenSet[Tuple[str, Any]]], Tuple[float, float, Any, Optional[Dict[str, str]]]] = OrderedDict()
+        self._expiries: List[Tuple[float, Tuple[str, FrozenSet[Tuple[str, Any]]]]] = []
+        self._lock = threading.Lock()
+
+    def _key(self, name: str, params: Mapping[str, Any]) -> Tuple[str, FrozenSet[Tuple[str, Any]]]:
+        # Param values are str/int, so the items hash directly; no sort needed
+        return (name, frozenset(params.items()))
+
+    def _sweep(self, now: float) -> None:
+        # Caller holds the lock. A heap entry whose expiry no longer matches
+        # the stored one belongs to an overwritten or evicted value.
+        heap = self._expiries
+        while heap and heap[0][0] <= now:
+            expiry, k = heapq.heappop(heap)
+            item = self.store.get(k)
+            if item is not None and item[1] == expiry:
+                del self.store[k]
+        if len(heap) > 2 * self.max_entries:
+            self._expiries = [(item[1], k) for k, item in self.store.items()]
+            heapq.heapify(self._expiries)
+
+    def lookup(self, name: str, params: Mapping[str, Any]) -> Tuple[Optional[Any], bool]:
+        """Return (value, fresh); value is None on a miss."""
         k = self._key(name, params)
-        item = self.store.get(k)
-        if not item:
-            return None
-        t, val = item
-        if _now() - t > self.ttl:
-            self.store.pop(k, None)
-            return None
-        return val
-
-    def set(self, name: str, params: Dict[str, Any], value: Any) -> None:
+        with self._lock:
+            now = _now()
+            self._sweep(now)
+            item = self.store.get(k)
+            if item is None:
+                return None, False
+            self.store.move_to_end(k)
+            return item[2], now < item[0]
+
+    def get(self, name: str, params: Mapping[str, Any]) -> Optional[Any]:
+        value, fresh = self.lookup(name, params)
+        return value if fresh else None
+
+    def validators(self, name: str, params: Mapping[str, Any]) -> Optional[Dict[str, str]]:
+        """The ETag/Last-Modified stored with an entry, for a conditional refetch."""
+        with self._lock:
+            item = self.store.get(self._key(name, params))
+            return item[3] if item is not None else None
+
+    def renew(self, name: str, params: Mapping[str, Any]) -> Optional[Any]:
+        """Make an entry fresh again (the server said it is unchanged); returns its value."""
         k = self._key(name, params)
-        self.store[k] = (_now(), value)
+        with self._lock:
+            item = self.store.get(k)
+            if item is None:
+                return None
+            now = _now()
+            fresh_until = now + self.ttl
+            expiry = fresh_until + self.stale_ttl
+            self.store[k] = (fresh_until, expiry, item[2], item[3])
+            self.store.move_to_end(k)
+            heapq.heappush(self._expiries, (expiry, k))
+            return item[2]
+
+    def set(
+        self,
+        name: str,
+        params: Mapping[str, Any],
+        value: Any,
+        ttl_override: float | None = None,
+        validators: Dict[str, str] | None = None,
+    ) -> None:
+        """Store value; with ttl_override it lives that long and is never served stale."""
+        k = self._key(name, params)
+        with self._lock:
+            now = _now()
+            self._sweep(now)
+            if ttl_override is None:
+                fresh_until = now + self.ttl
+                expiry = fresh_until + self.stale_ttl
+            else:
+                fresh_until = expiry = now + ttl_override
+            self.store[k] = (fresh_until, expiry, value, validators)
+            self.store.move_to_end(k)
+            heapq.heappush(self._expiries, (expiry, k))
+            if len(self.store) > self.max_entries:
+                self.store.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.store.clear()
+            self._expiries.clear()
 
 ttl_cache = TTLCache(CACHE_TTL)
+# Probe results; served fresh only, since they are cheap to refetch
+_STATIC_CACHE = TTLCache(STATIC_CACHE_TTL, stale_ttl=0.0)
+_HEALTH_CACHE = TTLCache(HEALTH_CACHE_TTL, stale_ttl=0.0)
+# Successful decompilations. A change of binary clears them (see
+# _check_loaded_binary); edits made in the UI are picked up as they expire
+_DECOMPILE_CACHE = TTLCache(DECOMPILE_CACHE_TTL, max_entries=512, stale_ttl=0.0)
+_NO_PARAMS: Dict[str, Any] = {}
+
+# Filename last reported by /status; a change means a different binary
+_loaded_binary: Optional[str] = None
+
+def _note_status(status: Any) -> None:
+    """Drop results for the previous binary once /status names a new one."""
+    global _loaded_binary
+    if not isinstance(status, dict):
+        return
+    filename = status.get("filename")
+    if filename != _loaded_binary:
+        if _loaded_binary is not None:
+            _STATIC_CACHE.clear()
+            _DECOMPILE_CACHE.clear()
+            ttl_cache.clear()
+        _loaded_binary = filename
+
+def _check_loaded_binary() -> None:
+    """Fetch /status at most once per HEALTH_CACHE_TTL so a binary switch is noticed
+    even by agents that never call health."""
+    if _HEALTH_CACHE.get("status", _NO_PARAMS) is not None:
+        return
+    status, err = _request("GET", "status")
+    if err is None:
+        _note_status(status)
+    _HEALTH_CACHE.set("status", _NO_PARAMS, True, ttl_override=None if err is None else ERROR_CACHE_TTL)
+
+def _cached_probe(cache: TTLCache, name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Cache a probe tool's result; failures only briefly."""
+    ttl = None if result.get("ok") else ERROR_CACHE_TTL
+    cache.set(name, _NO_PARAMS, result, ttl_override=ttl)
+    return result
+
+# Cache keys with a background refresh running; one refresh per key at a time
+_refreshing: set = set()
+_refreshing_lock = threading.Lock()
+
+# Cache keys being fetched on a miss, with the event their waiters block on
+_inflight: Dict[Tuple[str, FrozenSet[Tuple[str, Any]]], threading.Event] = {}
+_inflight_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=256)
+def _list_params(offset: int, limit: int, extra: Tuple[Tuple[str, Any], ...]) -> Mapping[str, Any]:
+    """Read-only request params for a page; paged scans repeat the same few."""
+    return MappingProxyType({"offset": offset, "limit": limit, **dict(extra)})
 
 def _list_endpoint(
     endpoint: str,
@@ -109,16 +369,80 @@ def _list_endpoint(
     limit: int,
     extra: Dict[str, Any] | None = None,
 ) -> Dict[str, Any]:
-    """Generic reader with TTL caching and uniform envelope."""
-    params = {"offset": offset, "limit": limit, **(extra or {})}
-    cached = ttl_cache.get(endpoint, params)
+    """Generic reader with TTL caching and uniform envelope.
+
+    A stale cached result is returned at once while a background thread
+    fetches the fresh one (stale-while-revalidate).
+    """
+    params = _list_params(offset, limit, tuple(extra.items()) if extra else ())
+    return _cached_list(endpoint, params, limit)
+
+def _cached_list(endpoint: str, params: Mapping[str, Any], limit: int) -> Dict[str, Any]:
+    """Serve a list request from the cache, fetching it once on a miss."""
+    cached, fresh = ttl_cache.lookup(endpoint, params)
     if cached is not None:
+        if not fresh:
+            _refresh_in_background(endpoint, params, limit)
         return cached
 
-    data, err = _request("GET", endpoint, params=params)
+    # Single-flight: concurrent misses on one key share the first caller's request
+    k = ttl_cache._key(endpoint, params)
+    with _inflight_lock:
+        event = _inflight.get(k)
+        leader = event is None
+        if leader:
+            event = _inflight[k] = threading.Event()
+    if not leader:
+        event.wait(READ_TIMEOUT + 1)
+        cached, _ = ttl_cache.lookup(endpoint, params)
+        if cached is not None:
+            return cached
+        return _fetch_list(endpoint, params, limit)
+    try:
+        return _fetch_list(endpoint, params, limit)
+    finally:
+        with _inflight_lock:
+            _inflight.pop(k, None)
+        event.set()
+
+def _refresh_in_background(endpoint: str, params: Mapping[str, Any], limit: int) -> None:
+    k = ttl_cache._key(endpoint, params)
+    with _refreshing_lock:
+        if k in _refreshing:
+            return
+        _refreshing.add(k)
+
+    def refresh() -> None:
+        try:
+            _fetch_list(endpoint, params, limit, revalidate=True)
+        except Exception as e:
+            logger.warning(f"Background refresh of {endpoint} failed: {e}")
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(k)
+
+    threading.Thread(target=refresh, name=f"refresh-{endpoint}", daemon=True).start()
+
+def _fetch_list(endpoint: str, params: Mapping[str, Any], limit: int, revalidate: bool = False) -> Dict[str, Any]:
+    """Request a list endpoint, normalize the envelope and cache it.
+
+    With revalidate, the cached entry's ETag/Last-Modified are sent along and
+    a 304 just renews that entry instead of transferring the list again.
+    """
+    validators = ttl_cache.validators(endpoint, params) if revalidate else None
+    meta: Dict[str, str] = {}
+    data, err = _request("GET", endpoint, params=params, validators=validators, meta=meta)
+    if data is NOT_MODIFIED:
+        renewed = ttl_cache.renew(endpoint, params)
+        if renewed is not None:
+            return renewed
+        # The entry was evicted meanwhile; fetch the body unconditionally
+        data, err = _request("GET", endpoint, params=params, meta=meta)
     if err:
         resp = {"ok": False, "error": err, "items": [], "hasMore": False}
-        ttl_cache.set(endpoint, params, resp)
+        # Errors are usually transient; keep them briefly, jittered so callers
+        # that failed together do not all retry at the same moment
+        ttl_cache.set(endpoint, params, resp, ttl_override=ERROR_CACHE_TTL * (1.0 + random.random() * 0.5))
         return resp
 
     # Accept list or JSON dicts from the bridge, normalize to {"items": [...]}.
@@ -134,29 +458,61 @@ def _list_endpoint(
         has_more = False
 
     resp = {"ok": True, "items": items, "hasMore": has_more}
-    ttl_cache.set(endpoint, params, resp)
+    ttl_cache.set(endpoint, params, resp, validators=meta or None)
     return resp
 
 # ──────────────────────────────────────────────────────────────────────────────
 # Tools (synchronous)
 # ──────────────────────────────────────────────────────────────────────────────
 
+# Input-validation failures, built once; returned as-is and never mutated
+_ERR_EMPTY_NAME = {"ok": False, "error": "Function name cannot be empty"}
+_ERR_NAME_OR_ADDRESS = {"ok": False, "error": "Either name or address must be provided"}
+_ERR_ADDRESS_REQUIRED = {"ok": False, "error": "Address is required"}
+_ERR_SIZE_RANGE = {"ok": False, "error": "Size must be between 1 and 4096 bytes"}
+_ERR_ADDRESS_OR_PATTERN = {"ok": False, "error": "Either address or pattern must be provided"}
+_ERR_UNEXPECTED_FORMAT = {"ok": False, "error": "Unexpected response format"}
+
 @mcp.tool()
 def health():
     """
     Cheap health probe for agents. Returns bridge reachability and basic status.
     """
     try:
+        cached = _HEALTH_CACHE.get("health", _NO_PARAMS)
+        if cached is not None:
+            return cached
         status, err = _request("GET", "status")
-        return {
+        _note_status(status)
+        return _cached_probe(_HEALTH_CACHE, "health", {
             "ok": err is None,
             "error": err,
             "status": status if isinstance(status, (str, dict)) else None,
-        }
+        })
     except Exception as e:
         logger.error(f"Health check failed: {e}")
         return {"ok": False, "error": str(e), "status": None}
 
+# Kinds list_entities accepts, each served by the bridge endpoint of that name
+_KIND_NAMES = ("methods", "classes", "segments", "imports", "exports", "data", "namespaces")
+_INVALID_KIND_ERROR = f"Invalid kind. Must be one of: {', '.join(_KIND_NAMES)}"
+
+def _make_fetcher(kind: str):
+    """Build list_entities' reader for one kind, with its endpoints fixed up front."""
+    # Method queries go to the bridge's dedicated search endpoint; other kinds
+    # pass the query through in case their endpoint supports filtering
+    search_endpoint = "searchFunctions" if kind == "methods" else kind
+
+    def fetch(offset: int, limit: int, query: str) -> Dict[str, Any]:
+        if query:
+            return _cached_list(search_endpoint, _list_params(offset, limit, (("query", query),)), limit)
+        return _cached_list(kind, _list_params(offset, limit, ()), limit)
+
+    fetch.__name__ = f"_fetch_{kind}"
+    return fetch
+
+_FETCHERS = {kind: _make_fetcher(kind) for kind in _KIND_NAMES}
+
 @mcp.tool()
 def list_entities(kind: str, offset: int = 0, limit: int = 100, query: str = ""):
     """
@@ -165,28 +521,17 @@ def list_entities(kind: str, offset: int = 0, limit: int = 100, query: str = "")
     """
     try:
         # Validate kind parameter
-        valid_kinds = ["methods", "classes", "segments", "imports", "exports", "data", "namespaces"]
-        if kind not in valid_kinds:
+        fetch = _FETCHERS.get(kind)
+        if fetch is None:
             return {
                 "ok": False,
-                "error": f"Invalid kind. Must be one of: {', '.join(valid_kinds)}",
+                "error": _INVALID_KIND_ERROR,
                 "items": [],
                 "hasMore": False
             }
 
         o, l = _clamp_paging(offset, limit)
-        endpoint = kind  # Use kind directly since we validated it
-
-        extra = {}
-        # If your bridge has a separate search endpoint for functions:
-        if query and kind == "methods":
-            # Prefer a dedicated search endpoint
-            return _list_endpoint("searchFunctions", offset=o, limit=l, extra={"query": query})
-        elif query:
-            # If other endpoints eventually support filtering, pass-through
-            extra["query"] = query
-
-        return _list_endpoint(endpoint, offset=o, limit=l, extra=extra)
+        return fetch(o, l, query)
     except Exception as e:
         logger.error(f"Error in list_entities: {e}")
         return {"ok": False, "error": str(e), "items": [], "hasMore": False}
@@ -256,7 +601,7 @@ def get_data_item(name: str = "", address: str = ""):
     """
     try:
         if not name and not address:
-            return {"ok": False, "error": "Either name or address must be provided"}
+            return _ERR_NAME_OR_ADDRESS
 
         # Prepare the request
         params = {}
@@ -281,6 +626,39 @@ def get_data_item(name: str = "", address: str = ""):
         logger.error(f"Error in get_data_item: {e}")
         return {"ok": False, "error": str(e)}
 
+# Non-printable bytes become "." in ASCII renderings
+_ASCII_TABLE = bytes(b if 0x20 <= b < 0x7F else 0x2E for b in range(256))
+
+def _as_bytes(data: Any) -> Optional[bytes]:
+    """Interpret the bridge's "bytes" reply (int list or hex string, bare or wrapped)."""
+    if isinstance(data, dict):
+        data = data.get("data", data.get("bytes"))
+    try:
+        if isinstance(data, list):
+            return bytes(data)
+        if isinstance(data, str):
+            return bytes.fromhex(data)
+    except (ValueError, TypeError):
+        pass
+    return None
+
+def _hexdump(raw: bytes, address: str) -> str:
+    try:
+        base = int(address, 0)
+    except ValueError:
+        base = 0
+    return "\n".join(
+        f"{base + off:08x}  {raw[off:off + 16].hex(' '):<47}  |{raw[off:off + 16].translate(_ASCII_TABLE).decode('ascii')}|"
+        for off in range(0, len(raw), 16)
+    )
+
+_MEMORY_FORMATTERS = {
+    "hex": lambda raw, address: binascii.hexlify(raw).decode("ascii"),
+    "bytes": lambda raw, address: list(raw),
+    "ascii": lambda raw, address: raw.translate(_ASCII_TABLE).decode("ascii"),
+    "hexdump": _hexdump,
+}
+
 @mcp.tool()
 def read_memory(address: str, size: int, format: str = "hex"):
     """
@@ -299,21 +677,27 @@ def read_memory(address: str, size: int, format: str = "hex"):
     """
     try:
         if not address:
-            return {"ok": False, "error": "Address is required"}
+            return _ERR_ADDRESS_REQUIRED
         if size <= 0 or size > 4096:  # Reasonable limit
-            return {"ok": False, "error": "Size must be between 1 and 4096 bytes"}
-
-        params = {
-            "address": address.strip(),
-            "size": size,
-            "format": format
-        }
-
-        # Request raw memory read
-        data, err = _request("GET", "memory", params=params)
-
-        if err:
-            return {"ok": False, "error": err}
+            return _ERR_SIZE_RANGE
+
+        address = address.strip()
+        data = None
+        if format in _MEMORY_FORMATTERS:
+            # Fetch raw bytes and format them here, in C-level bytes operations,
+            # rather than having the bridge build the larger text form
+            raw, err = _request("GET", "memory", params={"address": address, "size": size, "format": "bytes"})
+            if err:
+                return {"ok": False, "error": err}
+            raw = _as_bytes(raw)
+            if raw is not None:
+                data = _MEMORY_FORMATTERS[format](raw, address)
+
+        if data is None:
+            # Unknown format, or a raw reply we cannot interpret: let the bridge format it
+            data, err = _request("GET", "memory", params={"address": address, "size": size, "format": format})
+            if err:
+                return {"ok": False, "error": err}
 
         return {
             "ok": True,
@@ -340,7 +724,7 @@ def search_data_references(address: str = "", pattern: str = ""):
     """
     try:
         if not address and not pattern:
-            return {"ok": False, "error": "Either address or pattern must be provided"}
+            return _ERR_ADDRESS_OR_PATTERN
 
         params = {}
         if address:
@@ -371,15 +755,25 @@ def decompile_function(name: str):
     Decompile a function by exact name.
     """
     try:
-        if not name or not name.strip():
-            return {"ok": False, "error": "Function name cannot be empty"}
-
-        data, err = _request("POST", "decompile", data=name.strip())
+        name = name.strip() if name else ""
+        if not name:
+            return _ERR_EMPTY_NAME
+
+        # Agents ask for the same function repeatedly; reuse the decompilation
+        key = {"name": name}
+        _check_loaded_binary()
+        cached = _DECOMPILE_CACHE.get("decompile", key)
+        if cached is not None:
+            return cached
+
+        data, err = _request("POST", "decompile", data=name)
         if err:
             return {"ok": False, "error": err}
         # Normalize to JSON
-        code = data if isinstance(data, str) else json.dumps(data)
-        return {"ok": True, "code": code}
+        code = data if isinstance(data, str) else _json_text(data)
+        result = {"ok": True, "code": code}
+        _DECOMPILE_CACHE.set("decompile", key, result)
+        return result
     except Exception as e:
         logger.error(f"Error in decompile_function: {e}")
         return {"ok": False, "error": str(e)}
@@ -405,7 +799,7 @@ def get_function_callers(name: str):
     """
     try:
         if not name or not name.strip():
-            return {"ok": False, "error": "Function name cannot be empty"}
+            return _ERR_EMPTY_NAME
 
         # Try GET request first (it's simpler and more reliable)
         data, err = _request("GET", "function/callers", params={"name": name.strip()})
@@ -422,7 +816,7 @@ def get_function_callers(name: str):
         if isinstance(data, dict):
             return {"ok": True, **data}
         else:
-            return {"ok": False, "error": "Unexpected response format"}
+            return _ERR_UNEXPECTED_FORMAT
             
     except Exception as e:
         logger.error(f"Error in get_function_callers: {e}")
@@ -434,10 +828,13 @@ def overview():
     Get an overview of the loaded binary.
     """
     try:
+        cached = _STATIC_CACHE.get("overview", _NO_PARAMS)
+        if cached is not None:
+            return cached
         data, err = _request("GET", "overview")
         if err:
-            return {"ok": False, "error": err}
-        return {"ok": True, "overview": data}
+            return _cached_probe(_STATIC_CACHE, "overview", {"ok": False, "error": err})
+        return _cached_probe(_STATIC_CACHE, "overview", {"ok": True, "overview": data})
     except Exception as e:
         logger.error(f"Error in overview: {e}")
         return {"ok": False, "error": str(e)}
@@ -448,10 +845,13 @@ def get_binary_status():
     Get the current binary status and basic information.
     """
     try:
+        cached = _STATIC_CACHE.get("binary", _NO_PARAMS)
+        if cached is not None:
+            return cached
         data, err = _request("GET", "binary")
         if err:
-            return {"ok": False, "error": err}
-        return {"ok": True, "binary": data}
+            return _cached_probe(_STATIC_CACHE, "binary", {"ok": False, "error": err})
+        return _cached_probe(_STATIC_CACHE, "binary", {"ok": True, "binary": data})
     except Exception as e:
         logger.error(f"Error in get_binary_status: {e}")
         return {"ok": False, "error": str(e)}
@@ -466,11 +866,11 @@ if __name__ == "__main__":
     # Test connection on startup
     try:
         logger.info("Testing connection to Binary Ninja bridge...")
-        response = requests.get(f"{BINJA_URL}/status", timeout=5.0)
-        if response.status_code == 200:
+        response = _POOL.request("GET", f"{BINJA_URL}/status", timeout=5.0)
+        if response.status == 200:
             logger.info("✓ Successfully connected to Binary Ninja bridge")
         else:
-            logger.warning(f"⚠ Binary Ninja bridge returned status {response.status_code}")
+            logger.warning(f"⚠ Binary Ninja bridge returned status {response.status}")
     except Exception as e:
         logger.error(f"✗ Failed to connect to Binary Ninja bridge: {e}")
         logger.info("Server will start anyway - connection will be retried on first request")
@@ -15,23 +15,76 @@ import json
 import subprocess
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 
-def send_request(server_process, method, params=None):
-    """Send a request to the Binary Ninja MCP server."""
-    if params is None:
-        params = {}
-    
-    request = {
-        "id": 1,
-        "method": method,
-        "params": params
-    }
+# orjson is optional; it encodes and decodes several times faster than json
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+# Pipe buffer size; large responses (types, generated sources) are read from
+# the server's stdout in few big chunks instead of many 8 KiB ones
+PIPE_BUFFER_SIZE = 1 << 16
+
+def send_requests_batch(server_process, calls):
+    """Send several requests to the Binary Ninja MCP server in one write.
+
+    calls is a list of (method, params) pairs. All requests are written
+    before any response is read, so the server works through them without
+    waiting on a round-trip each; the responses are returned in call order.
+    """
+    lines = []
+    for request_id, (method, params) in enumerate(calls, 1):
+        lines.append(_json_dumps({
+            "id": request_id,
+            "method": method,
+            "params": params or {}
+        }))
     
-    server_process.stdin.write(json.dumps(request) + "\n")
+    server_process.stdin.write(b"\n".join(lines) + b"\n")
     server_process.stdin.flush()
     
-    response = json.loads(server_process.stdout.readline())
-    return response
+    responses = {}
+    for _ in calls:
+        response = _json_loads(server_process.stdout.readline())
+        responses[response.get("id")] = response
+    return [responses.get(request_id, {"error": "No response"}) for request_id in range(1, len(calls) + 1)]
+
+def print_lines(lines):
+    """Print lines with one write instead of a print() call per line."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def send_request(server_process, method, params=None):
+    """Send a request to the Binary Ninja MCP server."""
+    return send_requests_batch(server_process, [(method, params)])[0]
+
+class BinarySession:
+    """Requests against one binary, sent with the server-side handle from open_binary."""
+
+    def __init__(self, server_process, path):
+        self.server_process = server_process
+        response = send_request(server_process, "open_binary", {"path": path})
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        self.bv = response["result"]["bv_id"]
+
+    def batch(self, calls):
+        """Send (method, params) pairs in one write; see send_requests_batch."""
+        return send_requests_batch(self.server_process, [
+            (method, {**(params or {}), "bv": self.bv}) for method, params in calls
+        ])
+
+    def call(self, method, params=None):
+        """Send one request for this binary."""
+        return self.batch([(method, params)])[0]
 
 def main():
     if len(sys.argv) < 2:
@@ -39,33 +92,58 @@ def main():
         sys.exit(1)
     
     binary_path = os.path.abspath(sys.argv[1])
-    if not os.path.exists(binary_path):
-        print(f"Error: Binary file '{binary_path}' not found")
-        sys.exit(1)
     
-    # Start the Binary Ninja MCP server
+    # Start the Binary Ninja MCP server first; its interpreter starts up
+    # while the binary path is checked
     server_path = os.path.join(os.path.dirname(__file__), "binaryninja_server.py")
     server_process = subprocess.Popen(
         ["python3", server_path],
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1
+        bufsize=PIPE_BUFFER_SIZE
     )
     
     try:
-        # Test the server connection
-        response = send_request(server_process, "ping")
+        # Test the server connection in the background
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ping = executor.submit(send_request, server_process, "ping")
+            
+            if not os.path.exists(binary_path):
+                print(f"Error: Binary file '{binary_path}' not found")
+                server_process.terminate()
+                sys.exit(1)
+            
+            response = ping.result()
         if response.get("result") != "pong":
             print("Error: Failed to connect to the Binary Ninja MCP server")
             sys.exit(1)
         
         print("Connected to Binary Ninja MCP server")
+        session = BinarySession(server_process, binary_path)
+        
+        output_dir = sys.argv[2] if len(sys.argv) > 2 else None
+        
+        # Phase 1: everything that only needs the binary, in one batch. Only
+        # the first 10 functions and strings are shown, so only those and
+        # the totals are requested
+        calls = [
+            ("get_binary_info", {}),
+            ("list_sections", {}),
+            ("list_functions", {"limit": 10}),
+            ("list_functions", {"count_only": True}),
+            ("get_strings", {"min_length": 5, "limit": 10}),
+            ("get_strings", {"min_length": 5, "count_only": True}),
+        ]
+        if output_dir:
+            calls.append(("get_types", {}))
+        (info_response, sections_response, functions_response, functions_count,
+         strings_response, strings_count, *rest) = session.batch(calls)
+        types_response = rest[0] if rest else None
         
         # Get binary information
         print("\n=== Binary Information ===")
-        response = send_request(server_process, "get_binary_info", {"path": binary_path})
+        response = info_response
         if "error" in response:
             print(f"Error: {response['error']}")
             sys.exit(1)
@@ -82,92 +160,104 @@ def main():
         
         # List sections
         print("\n=== Sections ===")
-        response = send_request(server_process, "list_sections", {"path": binary_path})
+        response = sections_response
         if "error" in response:
             print(f"Error: {response['error']}")
             sys.exit(1)
         
         sections = response["result"]
-        for section in sections:
-            print(f"{section['name']}: {section['start']} - {section['end']} ({section['size']} bytes) [{section['semantics']}]")
+        print_lines([
+            f"{section['name']}: {section['start']} - {section['end']} ({section['size']} bytes) [{section['semantics']}]"
+            for section in sections
+        ])
         
         # List functions
         print("\n=== Functions ===")
-        response = send_request(server_process, "list_functions", {"path": binary_path})
+        response = functions_response
         if "error" in response:
             print(f"Error: {response['error']}")
             sys.exit(1)
         
         functions = response["result"]
-        for i, func in enumerate(functions[:10]):  # Show only first 10 functions
-            print(f"{i+1}. {func}")
+        # Only the first 10 functions were requested
+        print_lines([f"{i+1}. {func}" for i, func in enumerate(functions)])
         
-        if len(functions) > 10:
-            print(f"... and {len(functions) - 10} more functions")
+        total = functions_count.get("result", len(functions))
+        if total > 10:
+            print(f"... and {total - 10} more functions")
+        
+        # Phase 2: the requests that need a function name or write output
+        # files, again in one batch
+        func_name = functions[0] if functions else None
+        calls = []
+        if func_name:
+            calls.append(("disassemble_function", {"function": func_name}))
+            calls.append(("get_xrefs", {"function": func_name}))
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            header_path = os.path.join(output_dir, "generated_header.h")
+            source_path = os.path.join(output_dir, "generated_source.c")
+            driver_dir = os.path.join(output_dir, "driver")
+            is_driver = binary_path.endswith(".ko") or "driver" in binary_path.lower() or "module" in binary_path.lower()
+            if func_name:
+                calls.append(("decompile_function", {"function": func_name}))
+            calls.append(("generate_header", {"output_path": header_path}))
+            calls.append(("generate_source", {
+                "output_path": source_path,
+                "header_path": "generated_header.h"
+            }))
+            if is_driver:
+                calls.append(("rebuild_driver", {"output_dir": driver_dir}))
+        phase2 = dict(zip([method for method, _ in calls], session.batch(calls))) if calls else {}
         
         # If there are functions, disassemble the first one
-        if functions:
-            func_name = functions[0]
+        if func_name:
             print(f"\n=== Disassembly of '{func_name}' ===")
-            response = send_request(server_process, "disassemble_function", {
-                "path": binary_path,
-                "function": func_name
-            })
+            response = phase2["disassemble_function"]
             if "error" in response:
                 print(f"Error: {response['error']}")
                 sys.exit(1)
             
             disasm = response["result"]
-            for i, instr in enumerate(disasm):
-                print(f"{i+1:3d}. {instr}")
+            print_lines([f"{i+1:3d}. {instr}" for i, instr in enumerate(disasm)])
             
             # Get cross-references to this function
             print(f"\n=== Cross-references to '{func_name}' ===")
-            response = send_request(server_process, "get_xrefs", {
-                "path": binary_path,
-                "function": func_name
-            })
+            response = phase2["get_xrefs"]
             if "error" in response:
                 print(f"Error: {response['error']}")
                 sys.exit(1)
             
             xrefs = response["result"]
             if xrefs:
-                for xref in xrefs:
-                    print(f"From: {xref['from_function']} at {xref['from_address']} to {xref['to_address']}")
+                print_lines([
+                    f"From: {xref['from_function']} at {xref['from_address']} to {xref['to_address']}"
+                    for xref in xrefs
+                ])
             else:
                 print("No cross-references found")
         
         # Get strings
         print("\n=== Strings ===")
-        response = send_request(server_process, "get_strings", {
-            "path": binary_path,
-            "min_length": 5
-        })
+        response = strings_response
         if "error" in response:
             print(f"Error: {response['error']}")
             sys.exit(1)
         
         strings = response["result"]
-        for i, string in enumerate(strings[:10]):  # Show only first 10 strings
-            print(f"{i+1}. {string['address']}: '{string['value']}'")
+        # Only the first 10 strings were requested
+        print_lines([f"{i+1}. {string['address']}: '{string['value']}'" for i, string in enumerate(strings)])
         
-        if len(strings) > 10:
-            print(f"... and {len(strings) - 10} more strings")
+        total = strings_count.get("result", len(strings))
+        if total > 10:
+            print(f"... and {total - 10} more strings")
             
         # Source Code Reconstruction
-        if len(sys.argv) > 2:
-            output_dir = sys.argv[2]
-            os.makedirs(output_dir, exist_ok=True)
-            
+        if output_dir:
             # Decompile the first function
-            if functions:
-                func_name = functions[0]
+            if func_name:
                 print(f"\n=== Decompiled C Code for '{func_name}' ===")
-                response = send_request(server_process, "decompile_function", {
-                    "path": binary_path,
-                    "function": func_name
-                })
+                response = phase2["decompile_function"]
                 if "error" in response:
                     print(f"Error: {response['error']}")
                 else:
@@ -188,7 +278,7 @@ def main():
             
             # Extract types
             print("\n=== Data Types ===")
-            response = send_request(server_process, "get_types", {"path": binary_path})
+            response = types_response
             if "error" in response:
                 print(f"Error: {response['error']}")
             else:
@@ -201,61 +291,59 @@ def main():
                     if type_info['type_class'] == 'structure':
                         print(f"   Size: {type_info['size']} bytes")
                         print("   Members:")
-                        for member in type_info['members']:
-                            print(f"     - {member['name']}: {member['type']} (offset: {member['offset']})")
+                        print_lines([
+                            f"     - {member['name']}: {member['type']} (offset: {member['offset']})"
+                            for member in type_info['members']
+                        ])
                 
                 if len(types) > 5:
                     print(f"... and {len(types) - 5} more types")
                 
                 # Save types to file
                 types_path = os.path.join(output_dir, "types.json")
-                with open(types_path, "w") as f:
-                    json.dump(types, f, indent=2)
+                if orjson is not None:
+                    # Encode one type at a time so the whole document is
+                    # never held in memory at once
+                    with open(types_path, "wb", buffering=1 << 20) as f:
+                        separator = b"[\n  "
+                        for type_info in types:
+                            f.write(separator)
+                            f.write(orjson.dumps(type_info, option=orjson.OPT_INDENT_2).replace(b"\n", b"\n  "))
+                            separator = b",\n  "
+                        f.write(b"\n]" if types else b"[]")
+                else:
+                    with open(types_path, "w") as f:
+                        json.dump(types, f, indent=2)
                 print(f"Saved types to {types_path}")
             
             # Generate header file
             print("\n=== Generated Header File ===")
-            header_path = os.path.join(output_dir, "generated_header.h")
-            response = send_request(server_process, "generate_header", {
-                "path": binary_path,
-                "output_path": header_path
-            })
+            response = phase2["generate_header"]
             if "error" in response:
                 print(f"Error: {response['error']}")
             else:
                 header_content = response["result"]
                 print(f"Generated header file saved to {header_path}")
                 print("\nFirst 10 lines:")
-                for line in header_content.split("\n")[:10]:
-                    print(line)
+                print_lines(header_content.split("\n", 10)[:10])
                 print("...")
             
             # Generate source file
             print("\n=== Generated Source File ===")
-            source_path = os.path.join(output_dir, "generated_source.c")
-            response = send_request(server_process, "generate_source", {
-                "path": binary_path,
-                "output_path": source_path,
-                "header_path": "generated_header.h"
-            })
+            response = phase2["generate_source"]
             if "error" in response:
                 print(f"Error: {response['error']}")
             else:
                 source_content = response["result"]
                 print(f"Generated source file saved to {source_path}")
                 print("\nFirst 10 lines:")
-                for line in source_content.split("\n")[:10]:
-                    print(line)
+                print_lines(source_content.split("\n", 10)[:10])
                 print("...")
             
             # Rebuild driver (if it's a driver module)
-            if binary_path.endswith(".ko") or "driver" in binary_path.lower() or "module" in binary_path.lower():
+            if is_driver:
                 print("\n=== Rebuilding Driver Module ===")
-                driver_dir = os.path.join(output_dir, "driver")
-                response = send_request(server_process, "rebuild_driver", {
-                    "path": binary_path,
-                    "output_dir": driver_dir
-                })
+                response = phase2["rebuild_driver"]
                 if "error" in response:
                     print(f"Error: {response['error']}")
                 else:
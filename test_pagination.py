@@ -2,11 +2,12 @@
 """
 Test script to verify that pagination is working correctly in the Binary Ninja HTTP client.
 This script will load a binary file and retrieve all functions, demonstrating that
-pagination is working correctly by retrieving more than the default limit of 100 functions.
+pagination is working correctly by retrieving more than one page (PAGE_SIZE items) of functions.
 """
 
 import sys
 import json
+from concurrent.futures import ThreadPoolExecutor
 from binaryninja_http_client import BinaryNinjaHTTPClient
 
 def main():
@@ -35,38 +36,37 @@ def main():
             print(f"Error loading binary: {e}")
             sys.exit(1)
     
-    # Get all functions
-    print("\nRetrieving all functions...")
-    functions = client.list_functions()
-    print(f"Retrieved {len(functions)} functions in total")
-    
-    # Print the first 5 and last 5 functions to verify pagination is working
-    if functions:
-        print("\nFirst 5 functions:")
-        for i, func in enumerate(functions[:5]):
-            print(f"{i+1}. {func['name']} at {func.get('address', 'unknown')}")
-            
-        if len(functions) > 10:
-            print("\nLast 5 functions:")
-            for i, func in enumerate(functions[-5:]):
-                print(f"{len(functions)-4+i}. {func['name']} at {func.get('address', 'unknown')}")
-    
-    # Test other paginated methods
-    print("\nRetrieving all imports...")
-    imports = client.get_imports()
-    print(f"Retrieved {len(imports)} imports in total")
-    
-    print("\nRetrieving all exports...")
-    exports = client.get_exports()
-    print(f"Retrieved {len(exports)} exports in total")
-    
-    print("\nRetrieving all segments...")
-    segments = client.get_sections()
-    print(f"Retrieved {len(segments)} segments in total")
-    
-    print("\nRetrieving all data items...")
-    data_items = client.get_defined_data()
-    print(f"Retrieved {len(data_items)} data items in total")
+    # The listings are independent, so fetch them all at once and report
+    # them in order as they complete
+    listings = [
+        ("functions", client.list_functions),
+        ("imports", client.get_imports),
+        ("exports", client.get_exports),
+        ("segments", client.get_sections),
+        ("data items", client.get_defined_data),
+    ]
+    with ThreadPoolExecutor(max_workers=len(listings)) as executor:
+        futures = {name: executor.submit(fn) for name, fn in listings}
+        
+        # Get all functions
+        print("\nRetrieving all functions...")
+        functions = futures["functions"].result()
+        print(f"Retrieved {len(functions)} functions in total")
+        
+        # Print the first 5 and last 5 functions to verify pagination is working
+        if functions:
+            print("\nFirst 5 functions:")
+            print("\n".join(f"{i+1}. {func['name']} at {func.get('address', 'unknown')}" for i, func in enumerate(functions[:5])))
+                
+            if len(functions) > 10:
+                print("\nLast 5 functions:")
+                print("\n".join(f"{len(functions)-4+i}. {func['name']} at {func.get('address', 'unknown')}" for i, func in enumerate(functions[-5:])))
+        
+        # Test other paginated methods
+        for name, _ in listings[1:]:
+            print(f"\nRetrieving all {name}...")
+            items = futures[name].result()
+            print(f"Retrieved {len(items)} {name} in total")
     
     print("\nTest completed successfully!")
 